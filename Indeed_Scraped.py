@@ -1,13 +1,22 @@
 import undetected_chromedriver as uc
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException
+import requests
+import argparse
 import logging
 import time
 import random
 import os
-import json
+from urllib.parse import urlparse
+
+from job_parsers import parse_indeed_cards, is_blocked_page
+from crawl_engine import run_crawl, DEFAULT_RATE
+from browser_profile import apply_lean_options, block_resources, TransferStats
+from page_wait import wait_for_cards
+from crawl_metrics import histogram, CrawlMetrics, PageRecord, DEFAULT_METRICS_DIR
+from rate_limit import RateLimiter
+from debug_capture import DebugCapture, CAPTURE_MODES
+from crawl_state import CrawlState, CheckpointWriter, NoveltyTracker, DEFAULT_STATE_FILE
+from job_sink import JobSink
 
 # Setup logging
 logging.basicConfig(
@@ -16,25 +25,6 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
-# Initialize driver with stealth capabilities
-options = uc.ChromeOptions()
-options.add_argument("--start-maximized")
-options.add_argument("--disable-blink-features=AutomationControlled")
-options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36")
-options.add_argument("--no-sandbox")
-options.add_argument("--disable-dev-shm-usage")
-# options.add_argument("--headless")  # Uncomment after testing
-
-try:
-    driver = uc.Chrome(options=options)
-    logging.info("WebDriver initialized successfully")
-except Exception as e:
-    logging.error(f"Failed to initialize WebDriver: {e}")
-    raise
-
-# Remove navigator.webdriver flag
-driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-
 # Job roles and locations
 roles = [
     "data-analyst", "data-scientist", "machine-learning-engineer",
@@ -49,158 +39,388 @@ locations = [
 ]
 
 # Setup
-os.makedirs("Data/screenshots", exist_ok=True)
-os.makedirs("Data/clean", exist_ok=True)
-all_jobs = []
 max_jobs = 30000
 max_pages_per_role_location = 7  # Set to 7 for testing
 retries = 3
 output_file = "Data/clean/indeed_selenium_fixed.json"
+base_urls = ["https://in.indeed.com", "https://www.indeed.com"]  # Tried in this order
+min_request_interval = 5.0  # Seconds between requests to the same Indeed host
+save_batch_size = 200  # Jobs buffered before each append
+save_interval = 30.0  # ...or seconds the oldest buffered job may wait
+SITE = "indeed"  # Key for this scraper's checkpoints in the crawl state
+min_novelty = 0.2  # Stop paginating a role/location once fewer than 20% of a page's cards are new
+user_agent = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36"
+
+
+# Initialize driver with stealth capabilities
+def create_driver(lean=False):
+    options = uc.ChromeOptions()
+    if lean:
+        apply_lean_options(options)
+    else:
+        options.add_argument("--start-maximized")
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    options.add_argument(f"user-agent={user_agent}")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
 
-# Function to save jobs
-def save_jobs(jobs, file_path, append=True):
     try:
-        mode = 'a' if append and os.path.exists(file_path) else 'w'
-        with open(file_path, mode, encoding='utf-8') as f:
-            for job in jobs:
-                f.write(json.dumps(job, ensure_ascii=False) + '\n')
-        logging.info(f"Saved {len(jobs)} jobs to {file_path} (append={append})")
+        driver = uc.Chrome(options=options)
+        logging.info("WebDriver initialized successfully")
     except Exception as e:
-        logging.error(f"Error saving jobs to JSON: {e}")
-
-# Main scraping logic
-for role in roles:
-    logging.info(f"Starting scraping for role: {role}")
-    for location in locations:
-        if len(all_jobs) >= max_jobs:
-            logging.info(f"Reached global job limit of {max_jobs}")
+        logging.error(f"Failed to initialize WebDriver: {e}")
+        raise
+
+    # Remove navigator.webdriver flag
+    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    if lean:
+        block_resources(driver)
+    return driver
+
+
+# Pooled HTTP session for the http fetch mode; keeps connections to Indeed alive across pages
+def create_session():
+    session = requests.Session()
+    session.headers.update({
+        "User-Agent": user_agent,
+        "Accept-Language": "en-US,en;q=0.9",
+    })
+    adapter = requests.adapters.HTTPAdapter(pool_connections=2, pool_maxsize=4)
+    session.mount("https://", adapter)
+    return session
+
+
+# HTTP path of the http fetch mode. Once Indeed refuses a request (an error
+# status or a CAPTCHA page) it is marked blocked for the rest of the run, and
+# later pages go straight to the browser instead of asking twice per page.
+class HttpFetcher:
+    def __init__(self):
+        self.session = create_session()
+        self.blocked = False
+
+    def close(self):
+        self.session.close()
+
+
+# The browser is only started when a page actually needs it and then stays
+# warm for every following role and location
+class Browser:
+    def __init__(self, lean=False):
+        self.lean = lean
+        self.driver = None
+        self.stats = TransferStats()
+
+    def get(self):
+        if self.driver is None:
+            self.driver = create_driver(lean=self.lean)
+        return self.driver
+
+    # Close browser safely
+    def quit(self):
+        if self.driver is None:
+            return
+        try:
+            self.driver.quit()
+            logging.info("Browser closed successfully")
+        except Exception as e:
+            logging.error(f"Error closing browser: {e}")
+        finally:
+            self.driver = None  # Ensure driver is cleared
+
+
+# Fetch a search page with a plain HTTP request. Returns the parsed jobs, or
+# None when Indeed refuses the request or serves a page without job cards,
+# in which case the caller falls back to the browser.
+def fetch_with_http(http, rate_limiter, search_url, role, location, page, record):
+    try:
+        rate_limiter.wait(search_url)
+        with record.stage('fetch'):
+            response = http.session.get(search_url, timeout=20)
+    except requests.RequestException as e:
+        logging.warning(f"HTTP fetch failed for {search_url}: {e}")
+        return None
+    if response.status_code != 200 or is_blocked_page(response.text, response.url):
+        logging.warning(f"HTTP fetch blocked (status {response.status_code}), using the browser for the rest of the run")
+        http.blocked = True
+        return None
+    with record.stage('extract'):
+        jobs = parse_indeed_cards(response.text, role, location)
+    if not jobs:
+        logging.info(f"No job cards in HTTP response for page {page}, falling back to browser")
+        return None
+    logging.info(f"Found {len(jobs)} job cards on page {page} via HTTP")
+    return jobs
+
+
+# Load a search page in the browser and parse the page source once
+def fetch_with_browser(browser, capture, rate_limiter, search_url, url_idx, role, location, page, record):
+    for attempt in range(retries):
+        driver = browser.get()
+        try:
+            rate_limiter.wait(search_url)
+            logging.info(f"Page {page} (Attempt {attempt + 1}, URL {url_idx + 1}): {search_url}")
+            with record.stage('navigate'):
+                driver.get(search_url)
+
+            # Log page title and URL for debugging
+            logging.info(f"Page title: {driver.title}")
+            logging.info(f"Current URL: {driver.current_url}")
+
+            if "robot" in driver.current_url:
+                logging.error(f"Blocked by CAPTCHA or robot-check on page {page} for {role} in {location}")
+                record.captcha, record.outcome = True, 'captcha'
+                driver.save_screenshot(f"Data/screenshots/block_{role}_{location}_page_{page}_attempt_{attempt + 1}.png")
+                return []
+
+            # Wait until the job cards stop changing; scrolling loads the lazy ones
+            with record.stage('wait'):
+                cards, waited, _ = wait_for_cards(driver, "div.job_seen_beacon", timeout=30)
+            if not cards:
+                # A CAPTCHA page never shows job cards; check before retrying
+                page_source = driver.page_source
+                capture.page(page_source, f"{role}_{location}_page_{page}_attempt_{attempt + 1}", error=True)
+                if is_blocked_page(page_source, driver.current_url):
+                    logging.error(f"Blocked by CAPTCHA or robot-check on page {page} for {role} in {location}")
+                    record.captcha, record.outcome = True, 'captcha'
+                    driver.save_screenshot(f"Data/screenshots/block_{role}_{location}_page_{page}_attempt_{attempt + 1}.png")
+                    return []
+                raise TimeoutException(f"No job cards after {waited:.1f}s")
+            histogram("time_to_cards", SITE).observe(waited)
+
+            record.bytes = (browser.stats.record(driver) or {}).get('bytes')
+
+            # Serialize the page once and parse all cards from it
+            with record.stage('extract'):
+                page_source = driver.page_source
+                jobs = parse_indeed_cards(page_source, role, location)
+            logging.info(f"Found {len(jobs)} job cards on page {page}")
+            capture.page(page_source, f"{role}_{location}_page_{page}_attempt_{attempt + 1}", error=not jobs)
+
+            if not jobs:
+                logging.warning(f"No job cards found on page {page}")
+                record.outcome = 'empty'
+                driver.save_screenshot(f"Data/screenshots/no_cards_{role}_{location}_page_{page}_attempt_{attempt + 1}.png")
+            return jobs
+
+        except TimeoutException:
+            logging.warning(f"Timeout on page {page}, attempt {attempt + 1}")
+            record.outcome = 'timeout'
+            driver.save_screenshot(f"Data/screenshots/timeout_{role}_{location}_page_{page}_attempt_{attempt + 1}.png")
+            if attempt < retries - 1:
+                record.retries += 1
+                time.sleep(random.uniform(5, 10))
+                continue
             break
+        except WebDriverException as e:
+            logging.error(f"WebDriver error on page {page}: {e}")
+            record.outcome = 'error'
+            if attempt < retries - 1:
+                record.retries += 1
+                time.sleep(random.uniform(5, 10))
+                continue
+            break
+    return []
 
-        logging.info(f"Scraping {role} in {location}")
-        for page in range(1, max_pages_per_role_location + 1):
-            if len(all_jobs) >= max_jobs:
-                break
 
-            # Try both in.indeed.com and www.indeed.com
-            urls = [
-                f"https://in.indeed.com/jobs?q={role.replace('-', '+')}&l={location.replace(' ', '+')}&start={(page - 1) * 10}",
-                f"https://www.indeed.com/jobs?q={role.replace('-', '+')}&l={location.replace(' ', '+')}&start={(page - 1) * 10}"
-            ]
-
-            for url_idx, search_url in enumerate(urls):
-                job_cards = []  # Initialize job_cards to avoid NameError
-                for attempt in range(retries):
-                    try:
-                        logging.info(f"Page {page} (Attempt {attempt + 1}, URL {url_idx + 1}): {search_url}")
-                        driver.get(search_url)
-                        time.sleep(random.uniform(5, 8))
-
-                        # Log page title and URL for debugging
-                        logging.info(f"Page title: {driver.title}")
-                        logging.info(f"Current URL: {driver.current_url}")
-
-                        # Save page source for debugging
-                        source_file = f"Data/screenshots/page_source_{role}_{location}_page_{page}_attempt_{attempt + 1}.html"
-                        with open(source_file, "w", encoding="utf-8") as f:
-                            f.write(driver.page_source)
-                        logging.info(f"Saved page source to {source_file}")
-
-                        # Check for CAPTCHA or robot check
-                        if "robot" in driver.current_url or "captcha" in driver.page_source.lower():
-                            logging.error(f"Blocked by CAPTCHA or robot-check on page {page} for {role} in {location}")
-                            driver.save_screenshot(f"Data/screenshots/block_{role}_{location}_page_{page}_attempt_{attempt + 1}.png")
-                            break
+# Try both in.indeed.com and www.indeed.com (or the given bases, e.g. a local replay server)
+def build_urls(role, location, page, bases=base_urls):
+    return [
+        f"{base}/jobs?q={role.replace('-', '+')}&l={location.replace(' ', '+')}&start={(page - 1) * 10}"
+        for base in bases
+    ]
+
+
+# Scrape one result page, trying in.indeed.com and then www.indeed.com.
+# Stage timings, retries and the outcome are written to record (a PageRecord).
+def scrape_page(browser, http, capture, rate_limiter, role, location, page, record=None):
+    if record is None:
+        record = PageRecord(role, location, page)
+    for url_idx, search_url in enumerate(build_urls(role, location, page)):
+        jobs = None
+        if http is not None and not http.blocked:
+            jobs = fetch_with_http(http, rate_limiter, search_url, role, location, page, record)
+        if jobs is None:
+            jobs = fetch_with_browser(browser, capture, rate_limiter, search_url, url_idx, role, location, page, record)
+        if jobs:
+            record.cards, record.outcome = len(jobs), 'ok'
+            for job in jobs:
+                logging.info(f"Scraped job: {job['Title']} at {job['Company']}")
+            return jobs
+    return []
+
+
+# Crawl task for the async engine: fetch one (role, location, page) over HTTP
+async def fetch_page_async(engine, item, bases=base_urls):
+    role, location, page = item
+    for search_url in build_urls(role, location, page, bases):
+        result = await engine.fetch(search_url)
+        if result.status != 200 or is_blocked_page(result.text, result.final_url):
+            logging.warning(f"Blocked or failed (status {result.status}) on page {page} for {role} in {location}: {search_url}")
+            continue
+        jobs = parse_indeed_cards(result.text, role, location)
+        logging.info(f"Found {len(jobs)} job cards on page {page} for {role} in {location}")
+        if jobs:
+            return jobs
+    return []
+
+
+# Crawl every pending (role, location, page) concurrently with the asyncio engine.
+# host_rates overrides the engine's requests per second per host (e.g. for a replay server).
+def run_async(items, writer, limit, max_in_flight, novelty, metrics, bases=base_urls, host_rates=None):
+    async def handle(engine, item):
+        if novelty.skip(*item):
+            return []
+        record = metrics.page(*item)
+        with record.stage('fetch'):
+            jobs = await fetch_page_async(engine, item, bases)
+        record.cards = len(jobs)
+        record.outcome = 'ok' if jobs else 'empty'
+        metrics.finish(record)
+        return jobs
+
+    def on_result(item, jobs):
+        if jobs:
+            total = len(jobs)
+            jobs = writer.state.new_jobs(SITE, jobs)
+            novelty.observe(*item, total, len(jobs))
+            remaining = limit - writer.saved - len(writer.buffer)
+            writer.add(item, jobs[:remaining], remaining >= len(jobs))
+        if writer.saved + len(writer.buffer) >= limit:
+            logging.info(f"Reached max job limit of {max_jobs}")
+            return False
+        return True
 
-                        # Scroll multiple times to load dynamic content
-                        for _ in range(3):
-                            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                            time.sleep(random.uniform(1, 3))
-
-                        # Wait for job cards
-                        WebDriverWait(driver, 30).until(
-                            EC.presence_of_all_elements_located((By.CSS_SELECTOR, "div.job_seen_beacon"))
-                        )
-
-                        job_cards = driver.find_elements(By.CSS_SELECTOR, "div.job_seen_beacon")
-                        logging.info(f"Found {len(job_cards)} job cards on page {page}")
-
-                        if not job_cards:
-                            logging.warning(f"No job cards found on page {page}")
-                            driver.save_screenshot(f"Data/screenshots/no_cards_{role}_{location}_page_{page}_attempt_{attempt + 1}.png")
-                            if url_idx == len(urls) - 1:  # Last URL tried
-                                break
-                            continue
-
-                        for job in job_cards:
-                            try:
-                                title = job.find_element(By.CSS_SELECTOR, "h2.jobTitle a span").text.strip() if job.find_elements(By.CSS_SELECTOR, "h2.jobTitle a span") else "N/A"
-                                company = job.find_element(By.CSS_SELECTOR, "span[data-testid='company-name']").text.strip() if job.find_elements(By.CSS_SELECTOR, "span[data-testid='company-name']") else "N/A"
-                                location_text = job.find_element(By.CSS_SELECTOR, "div[data-testid='text-location']").text.strip() if job.find_elements(By.CSS_SELECTOR, "div[data-testid='text-location']") else "N/A"
-                                salary = job.find_element(By.CSS_SELECTOR, "div[data-testid='attribute_snippet_testid']").text.strip() if job.find_elements(By.CSS_SELECTOR, "div[data-testid='attribute_snippet_testid']") else "Not Disclosed"
-                                skills = [skill.text.strip() for skill in job.find_elements(By.CSS_SELECTOR, "div.jobsearch-Skills-container")] if job.find_elements(By.CSS_SELECTOR, "div.jobsearch-Skills-container") else []
-
-                                job_data = {
-                                    "Role": role,
-                                    "Location": location,
-                                    "Title": title,
-                                    "Company": company,
-                                    "Location_Detail": location_text,
-                                    "Salary": salary,
-                                    "Skills": skills
-                                }
-                                all_jobs.append(job_data)
-                                logging.info(f"Scraped job: {title} at {company}")
-
-                                if len(all_jobs) >= max_jobs:
-                                    logging.info(f"Reached max job limit of {max_jobs}")
-                                    break
-
-                            except Exception as e:
-                                logging.warning(f"Error parsing job card: {e}")
-                                continue
-
-                        break  # Break retry loop on success
-
-                    except TimeoutException:
-                        logging.warning(f"Timeout on page {page}, attempt {attempt + 1}")
-                        driver.save_screenshot(f"Data/screenshots/timeout_{role}_{location}_page_{page}_attempt_{attempt + 1}.png")
-                        if attempt < retries - 1:
-                            time.sleep(random.uniform(5, 10))
-                            continue
+    run_crawl(items, handle, on_result, max_in_flight=max_in_flight, host_rates=host_rates)
+    writer.flush()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scrape Indeed job postings for each role and location.")
+    parser.add_argument('--fetch', choices=['browser', 'http', 'async'], default='browser',
+                        help="'http' tries a pooled HTTP session first and only uses the browser when blocked; "
+                             "'async' crawls over HTTP only with the concurrent asyncio engine")
+    parser.add_argument('--max-in-flight', type=int, default=8,
+                        help="Concurrent requests in async mode (default: 8)")
+    parser.add_argument('--base-url', action='append', default=None,
+                        help="Crawl this site instead of Indeed in async mode, e.g. http://127.0.0.1:8000 "
+                             "(repeat to try several, like in.indeed.com and www.indeed.com)")
+    parser.add_argument('--rate', type=float, default=DEFAULT_RATE,
+                        help=f"Requests per second to each --base-url host (default: {DEFAULT_RATE})")
+    parser.add_argument('--min-interval', type=float, default=min_request_interval,
+                        help=f"Seconds between requests to the same Indeed host (default: {min_request_interval})")
+    parser.add_argument('--lean', action='store_true',
+                        help="Headless browser that blocks images, media, fonts and analytics requests")
+    parser.add_argument('--capture', choices=CAPTURE_MODES, default='error',
+                        help="Save gzipped page sources: never, only for failed pages (default), or also a sample of good ones")
+    parser.add_argument('--capture-rate', type=float, default=0.05, help="Share of good pages saved in sampled mode")
+    parser.add_argument('--capture-quota-mb', type=float, default=100,
+                        help="Disk quota for page source snapshots; the oldest are deleted first (default: 100)")
+    parser.add_argument('--state', default=DEFAULT_STATE_FILE,
+                        help=f"SQLite checkpoint file used to resume an interrupted crawl (default: {DEFAULT_STATE_FILE})")
+    parser.add_argument('--metrics', default=os.path.join(DEFAULT_METRICS_DIR, f"{SITE}_crawl.jsonl"),
+                        help="JSONL file receiving one line per page and per saved batch ('' to disable)")
+    parser.add_argument('--prometheus', default=None,
+                        help="Also keep Prometheus text-format metrics in this file (for node_exporter's textfile collector)")
+    parser.add_argument('--fresh', action='store_true',
+                        help="Start a new crawl of every page; postings saved before are still treated as seen")
+    parser.add_argument('--min-novelty', type=float, default=min_novelty,
+                        help=f"Stop paginating a role/location when the share of new cards on a page drops below this "
+                             f"(default: {min_novelty}; 0 disables)")
+    args = parser.parse_args()
+
+    os.makedirs("Data/screenshots", exist_ok=True)
+    os.makedirs("Data/clean", exist_ok=True)
+
+    # Resume from the checkpoints of earlier runs
+    state = CrawlState(args.state)
+    if args.fresh:
+        state.reset(SITE)
+    done = state.completed_pages(SITE)
+    limit = max_jobs - state.saved_count(SITE)
+    novelty = NoveltyTracker(state, SITE, args.min_novelty)
+    if done:
+        logging.info(f"Resuming: skipping {len(done)} completed pages, {max_jobs - limit} jobs already saved")
+    metrics = CrawlMetrics(SITE, args.metrics or None, args.prometheus)
+    sink = JobSink(output_file, save_batch_size, save_interval, committed_size=state.committed_size(output_file))
+    writer = CheckpointWriter(state, SITE, sink, metrics)
+
+    if args.fetch == 'async':
+        items = [(role, location, page) for role in roles for location in locations
+                 for page in range(1, max_pages_per_role_location + 1)
+                 if (role, location, page) not in done and not novelty.skip(role, location, page)]
+        try:
+            if args.base_url:
+                host_rates = {urlparse(base).netloc: args.rate for base in args.base_url}
+                run_async(items, writer, limit, args.max_in_flight, novelty, metrics, args.base_url, host_rates)
+            else:
+                run_async(items, writer, limit, args.max_in_flight, novelty, metrics)
+        finally:
+            sink.close()
+            state.close()
+            metrics.close()
+        print(metrics.summary())
+        total_saved = writer.saved
+        if total_saved:
+            print(f"✅ Done. Scraped and saved {total_saved} jobs to {output_file}.")
+        else:
+            print("⚠️ No jobs scraped. Check scraper.log and screenshots for details.")
+        return
+
+    browser = Browser(lean=args.lean)
+    http = HttpFetcher() if args.fetch == 'http' else None
+    capture = DebugCapture(args.capture, args.capture_rate, quota_mb=args.capture_quota_mb)
+    rate_limiter = RateLimiter(args.min_interval, jitter=args.min_interval / 2)
+
+    # Main scraping logic
+    try:
+        for role in roles:
+            logging.info(f"Starting scraping for role: {role}")
+            for location in locations:
+                if writer.saved + len(writer.buffer) >= limit:
+                    logging.info(f"Reached global job limit of {max_jobs}")
+                    break
+
+                logging.info(f"Scraping {role} in {location}")
+                for page in range(1, max_pages_per_role_location + 1):
+                    if novelty.skip(role, location, page):
                         break
-                    except WebDriverException as e:
-                        logging.error(f"WebDriver error on page {page}: {e}")
-                        if attempt < retries - 1:
-                            time.sleep(random.uniform(5, 10))
-                            continue
+                    if (role, location, page) in done:
+                        continue
+                    remaining = limit - writer.saved - len(writer.buffer)
+                    if remaining <= 0:
+                        logging.info(f"Reached max job limit of {max_jobs}")
                         break
+                    record = metrics.page(role, location, page)
+                    jobs = scrape_page(browser, http, capture, rate_limiter, role, location, page, record)
+                    metrics.finish(record)
+                    if jobs:  # Failed or empty pages are not checkpointed and get retried next run
+                        total = len(jobs)
+                        jobs = state.new_jobs(SITE, jobs)
+                        writer.add((role, location, page), jobs[:remaining], remaining >= len(jobs))
+                        if novelty.observe(role, location, page, total, len(jobs)):
+                            break
 
-                if len(all_jobs) >= max_jobs or len(job_cards) > 0:
-                    break  # Move to next page if jobs were found or max limit reached
-
-            if len(all_jobs) >= max_jobs:
+            if writer.saved >= limit:
                 break
+    finally:
+        browser.quit()
+        capture.close()
+        if http is not None:
+            http.close()
+
+    # Final save
+    sink.close()
+    state.close()
+    metrics.close()
+    logging.info(f"Browser transfer: {browser.stats.summary()}")
+    logging.info(f"Time to cards: {histogram('time_to_cards', SITE).summary()}")
+    print(metrics.summary())
+    total_saved = writer.saved
+    if total_saved:
+        print(f"✅ Done. Scraped and saved {total_saved} jobs to {output_file}.")
+    else:
+        print("⚠️ No jobs scraped. Check scraper.log and screenshots for details.")
+
 
-        # Save jobs incrementally after each location
-        if all_jobs:
-            save_jobs(all_jobs, output_file, append=True)
-            all_jobs = []
-
-    if len(all_jobs) >= max_jobs:
-        break
-
-# Close browser safely
-try:
-    driver.quit()
-    logging.info("Browser closed successfully")
-except Exception as e:
-    logging.error(f"Error closing browser: {e}")
-finally:
-    driver = None  # Ensure driver is cleared
-
-# Final save
-if all_jobs:
-    save_jobs(all_jobs, output_file, append=True)
-    print(f"✅ Done. Scraped and saved {len(all_jobs)} jobs to {output_file}.")
-else:
-    print("⚠️ No jobs scraped. Check scraper.log and screenshots for details.")
\ No newline at end of file
+if __name__ == '__main__':
+    main()
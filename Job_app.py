@@ -1,25 +1,104 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 
 from reportlab.lib.pagesizes import letter
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
 from reportlab.lib.styles import getSampleStyleSheet
+import hashlib
 import io
+import json
+import os
+
+from job_index import build_skill_index, rows_with_any_skill, positions_to_mask, build_title_index, search_titles
+from salary_parser import parse_salary, salary_bucket, SALARY_COLUMNS
+from job_store import read_store
+from job_cube import read_cube, query_cube, cube_path
+from canonical import canonical_locations, canonical_companies
 
 # Set page config
 st.set_page_config(page_title="CareerVue: Job Market Insights", layout="wide")
 
-# Load cleaned data
-@st.cache_data
+# Load cleaned data, memory-mapping the columnar store when it has been built
+# (python job_store.py cleaned_job_data_with_skills.csv) and falling back to the CSV
+DATA_CSV = 'cleaned_job_data_with_skills.csv'
+DATA_STORE = 'cleaned_job_data_with_skills.parquet'
+# Aggregate cube for the charts (python job_cube.py cleaned_job_data_with_skills.csv)
+DATA_CUBE = cube_path(DATA_CSV)
+
+# Filter results are memoized per filter combination; entries expire after
+# FILTER_CACHE_TTL seconds and the least recently used beyond FILTER_CACHE_ENTRIES are evicted
+FILTER_CACHE_TTL = 3600
+FILTER_CACHE_ENTRIES = 256
+
+# Job listings are shown one page at a time; downloads are encoded on request in chunks of rows
+LISTING_COLUMNS = ['title', 'company', 'location', 'salary', 'role', 'source', 'skills']
+LISTING_PAGE_SIZES = [25, 50, 100, 250]
+DOWNLOAD_CHUNK_ROWS = 50000
+
+# Rendered roadmap PDFs kept per (role, content hash); enough for every role plus edited versions
+ROADMAP_PDF_CACHE_ENTRIES = 32
+
+# The frame is shared read-only by every session and rerun (cache_resource), so
+# it is not unpickled into a private copy each time; callers must not modify it
+@st.cache_resource
 def load_data():
-    df = pd.read_csv('cleaned_job_data_with_skills.csv')
+    if os.path.isdir(DATA_STORE):
+        return read_store(DATA_STORE)
+    df = pd.read_csv(DATA_CSV)
     # Normalize role names to match skill_to_roles (e.g., "Data-Analyst" -> "Data Analyst")
     df['role'] = df['role'].str.replace('-', ' ').str.title()
+    # Files cleaned before canonicalization may still hold "Bengaluru" / "Wipro Limited" style aliases
+    df['location'] = canonical_locations(df['location'])
+    df['company'] = canonical_companies(df['company'])
+    # Older cleaned files only carry the salary label, so parse it once here
+    if not set(SALARY_COLUMNS).issubset(df.columns):
+        df[SALARY_COLUMNS] = parse_salary(df['salary'])
+    df['salary_bucket'] = salary_bucket(df['salary_mid'])
     return df
 
+# Count postings per value, dropping categories that no longer occur after filtering
+def count_postings(series):
+    counts = series.value_counts()
+    return counts[counts > 0]
+
+# Encode the given rows as a CSV or Parquet file in memory; st.download_button
+# calls this when clicked and takes the whole file as bytes. CSV is encoded
+# DOWNLOAD_CHUNK_ROWS rows at a time, which bounds the intermediate CSV text
+# but not the finished file.
+def encode_rows(data, rows, file_format):
+    buffer = io.BytesIO()
+    if file_format == "Parquet":
+        data.iloc[rows].to_parquet(buffer, index=False)
+    else:
+        for start in range(0, len(rows), DOWNLOAD_CHUNK_ROWS):
+            chunk = data.iloc[rows[start:start + DOWNLOAD_CHUNK_ROWS]]
+            buffer.write(chunk.to_csv(index=False, header=start == 0).encode('utf-8'))
+    return buffer.getvalue()
+
+# Parse the skills column once into an inverted index (skill -> row positions)
+@st.cache_resource
+def load_skill_index():
+    return build_skill_index(load_data()['skills'])
+
+# Index the titles once (case-folded, token -> row positions) for the title search
+@st.cache_resource
+def load_title_index():
+    return build_title_index(load_data()['title'])
+
+# Load the aggregate cube, unless it is missing or older than the data it summarizes
+@st.cache_resource
+def load_cube():
+    data_path = DATA_STORE if os.path.isdir(DATA_STORE) else DATA_CSV
+    if not os.path.isdir(DATA_CUBE) or os.path.getmtime(DATA_CUBE) < os.path.getmtime(data_path):
+        return None
+    return read_cube(DATA_CUBE)
+
 df = load_data()
+all_skills, skill_postings = load_skill_index()
+title_index = load_title_index()
 
 # Define a color palette for the charts (distinct colors that work in both light and dark themes)
 color_palette = [
@@ -182,12 +261,84 @@ skill_to_roles = {
 
 }
 
-# Extract all unique skills from the skills column
-all_skills = set()
-for skills in df['skills'].dropna():
-    if isinstance(skills, str):
-        for skill in skills.split(", "):
-            all_skills.add(skill.strip())
+# Render a career roadmap as PDF bytes
+def create_roadmap_pdf(role, roadmap):
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=letter)
+    styles = getSampleStyleSheet()
+    story = []
+
+    story.append(Paragraph(f"CodeMantra Career Roadmap for {role}", styles['Title']))
+    story.append(Spacer(1, 12))
+    story.append(Paragraph(f"Skills Required: {', '.join(roadmap['skills'])}", styles['Heading2']))
+    story.append(Spacer(1, 12))
+    story.append(Paragraph("Roadmap to Prepare:", styles['Heading2']))
+    story.append(Spacer(1, 6))
+    for step in roadmap['roadmap']:
+        story.append(Paragraph(f"{step['step']}: {step['description']} (Resources: {step['resources']})", styles['Normal']))
+        story.append(Spacer(1, 6))
+
+    doc.build(story)
+    return buffer.getvalue()
+
+# Hash of a roadmap's content, so an edited roadmap is rendered again instead of served stale
+def roadmap_hash(roadmap):
+    return hashlib.sha256(json.dumps(roadmap, sort_keys=True).encode('utf-8')).hexdigest()
+
+# Roadmap PDF bytes, rendered once per (role, content hash) and shared by all sessions
+@st.cache_resource(max_entries=ROADMAP_PDF_CACHE_ENTRIES, show_spinner=False)
+def render_roadmap_pdf(role, content_hash):
+    return create_roadmap_pdf(role, roadmaps[role])
+
+# Normalize the sidebar values into a hashable key, so the same selection in a
+# different order or with different title casing hits the same cache entry
+def filter_key(source, locations, roles, title, salary_range, skills):
+    return (source, tuple(sorted(locations)), tuple(sorted(roles)), title.strip().casefold(),
+            tuple(salary_range), tuple(sorted(skills)))
+
+# Filter + aggregation stage, memoized on the filter key: switching a chart type
+# or going back to an earlier filter combination reuses the result. Returns the
+# positions of the matching rows and the counts behind every chart; without a
+# title search or skills filter the counts come from the aggregate cube.
+@st.cache_data(ttl=FILTER_CACHE_TTL, max_entries=FILTER_CACHE_ENTRIES, show_spinner=False)
+def filter_and_aggregate(source, locations, roles, title, salary_range, skills):
+    data = load_data()
+    mask = np.ones(len(data), dtype=bool)
+    if source != "Both":
+        mask &= (data['source'] == source).to_numpy()
+    if locations:
+        mask &= data['location'].isin(locations).to_numpy()
+    if roles:
+        mask &= data['role'].isin(roles).to_numpy()
+    if title:
+        mask &= positions_to_mask(search_titles(title_index, title), len(data))
+    # Undisclosed salaries count as 0 so they stay visible at the default range
+    salary_numeric = data['salary_mid'].fillna(0)
+    mask &= ((salary_numeric >= salary_range[0] * 100000) & (salary_numeric <= salary_range[1] * 100000)).to_numpy()
+    if skills:
+        # First, keep jobs that have any of the selected skills
+        mask &= positions_to_mask(rows_with_any_skill(skill_postings, skills), len(data))
+        # Then, optionally keep the related roles (relaxed to avoid over-filtering)
+        related_roles = set()
+        for skill in skills:
+            related_roles.update(skill_to_roles.get(skill, []))
+        if related_roles:
+            mask &= data['role'].isin(related_roles).to_numpy()
+
+    rows = np.flatnonzero(mask)
+    cube = load_cube()
+    if cube is not None and not title and not skills:
+        return rows, query_cube(cube, source, locations, roles, salary_range)
+    filtered = data.iloc[rows]
+    skills_series = filtered['skills'].dropna().str.split(", ").explode().str.strip()
+    counts = {
+        'role': count_postings(filtered['role']),
+        'salary_bucket': count_postings(filtered['salary_bucket']),
+        'location': count_postings(filtered['location']).head(10),
+        'skills': skills_series.value_counts().head(10),
+        'company': count_postings(filtered['company']).head(10),
+    }
+    return rows, counts
 
 # Homepage
 st.title("CareerVue:  A platform that gives you a clear view into career trends")
@@ -195,8 +346,8 @@ st.markdown("Explore India's tech job trends from Naukri and Indeed. Select a ro
 
 # Sidebar for filters and roadmap selection
 st.sidebar.header("Filter Options")
-location_filter = st.sidebar.multiselect("Select Location", options=df['location'].unique(), default=[])
-role_filter = st.sidebar.multiselect("Select Role", options=df['role'].unique(), default=[])
+location_filter = st.sidebar.multiselect("Select Location", options=df['location'].dropna().unique().tolist(), default=[])
+role_filter = st.sidebar.multiselect("Select Role", options=df['role'].dropna().unique().tolist(), default=[])
 source_option = st.sidebar.selectbox("Select Data Source", options=["Both", "Naukri", "Indeed"], index=0)
 title_search = st.sidebar.text_input("Search Job Title")
 
@@ -205,69 +356,17 @@ st.sidebar.subheader("Advanced Filters")
 salary_filter = st.sidebar.slider("Salary Range (₹ Lakhs)", min_value=0, max_value=50, value=(0, 50))
 
 # Skills filter using the skills from the CSV
-skills_filter = st.sidebar.multiselect("Select Skills", options=sorted(list(all_skills)), default=[])
+skills_filter = st.sidebar.multiselect("Select Skills", options=all_skills, default=[])
 
-# Filter data based on source
-if source_option == "Naukri":
-    filtered_df = df[df['source'] == 'Naukri']
-elif source_option == "Indeed":
-    filtered_df = df[df['source'] == 'Indeed']
-else:
-    filtered_df = df.copy()
-
-# Apply location filter
-if location_filter:
-    filtered_df = filtered_df[filtered_df['location'].isin(location_filter)]
-
-# Apply role filter
-if role_filter:
-    filtered_df = filtered_df[filtered_df['role'].isin(role_filter)]
-
-# Apply title search
-if title_search:
-    filtered_df = filtered_df[filtered_df['title'].str.lower().str.contains(title_search.lower(), na=False)]
-
-# Apply salary filter
-if 'salary' in filtered_df.columns:
-    def convert_salary_to_numeric(salary):
-        if isinstance(salary, str):
-            if '-' in salary:
-                try:
-                    low, high = map(float, salary.split('-'))
-                    return (low + high) / 2
-                except:
-                    return 0
-            elif salary == 'Not Disclosed':
-                return 0
-            try:
-                return float(salary)
-            except:
-                return 0
-        return 0
-
-    filtered_df['salary_numeric'] = filtered_df['salary'].apply(convert_salary_to_numeric)
-    filtered_df = filtered_df[
-        (filtered_df['salary_numeric'] >= salary_filter[0] * 100000) & 
-        (filtered_df['salary_numeric'] <= salary_filter[1] * 100000)
-    ]
-
-# Apply skills filter and map to roles
-if skills_filter:
-    # First, filter jobs that have any of the selected skills
-    filtered_df = filtered_df[filtered_df['skills'].apply(
-        lambda skills: isinstance(skills, str) and any(skill in skills.split(", ") for skill in skills_filter)
-    )]
-    # Then, optionally filter by related roles (relaxed to avoid over-filtering)
-    related_roles = set()
-    for skill in skills_filter:
-        if skill in skill_to_roles:
-            related_roles.update(skill_to_roles[skill])
-    if related_roles:
-        filtered_df = filtered_df[filtered_df['role'].isin(related_roles)]
-    # If no related roles match, don't filter further to avoid empty results
-
-# Check if filtered_df is empty after applying filters
-if filtered_df.empty:
+# Pre-render the roadmap PDFs of all roles; after the first run these are cache hits
+roadmap_pdfs = {role: render_roadmap_pdf(role, roadmap_hash(roadmap)) for role, roadmap in roadmaps.items()}
+
+# Apply the source, location, role, title, salary and skills filters (cached per filter combination)
+current_filters = filter_key(source_option, location_filter, role_filter, title_search, salary_filter, skills_filter)
+filtered_rows, chart_counts = filter_and_aggregate(*current_filters)
+
+# Check if any job matches the filters
+if len(filtered_rows) == 0:
     st.warning("No jobs match the selected filters. Please adjust your filters to see results.")
 else:
     # Roadmap feature
@@ -281,37 +380,16 @@ else:
         for step in roadmap['roadmap']:
             st.write(f"- **{step['step']}**: {step['description']} (Resources: {step['resources']})")
 
-        def create_roadmap_pdf(role, roadmap):
-            buffer = io.BytesIO()
-            doc = SimpleDocTemplate(buffer, pagesize=letter)
-            styles = getSampleStyleSheet()
-            story = []
-
-            story.append(Paragraph(f"CodeMantra Career Roadmap for {role}", styles['Title']))
-            story.append(Spacer(1, 12))
-            story.append(Paragraph(f"Skills Required: {', '.join(roadmap['skills'])}", styles['Heading2']))
-            story.append(Spacer(1, 12))
-            story.append(Paragraph("Roadmap to Prepare:", styles['Heading2']))
-            story.append(Spacer(1, 6))
-            for step in roadmap['roadmap']:
-                story.append(Paragraph(f"{step['step']}: {step['description']} (Resources: {step['resources']})", styles['Normal']))
-                story.append(Spacer(1, 6))
-
-            doc.build(story)
-            buffer.seek(0)
-            return buffer
-
-        pdf_buffer = create_roadmap_pdf(roadmap_role, roadmap)
         st.download_button(
             label=f"Download {roadmap_role} Roadmap PDF",
-            data=pdf_buffer,
+            data=roadmap_pdfs[roadmap_role],
             file_name=f"{roadmap_role}_Roadmap.pdf",
             mime="application/pdf"
         )
 
     # Trending jobs by role
     st.header("Trending Jobs by Role")
-    role_counts = filtered_df['role'].value_counts()
+    role_counts = chart_counts['role']
     st.write("Roles based on job postings:")
     for role, count in role_counts.items():
         st.write(f"- {role}: {count} postings")
@@ -322,7 +400,6 @@ else:
 
     if skills_filter:
         st.write(f"Showing roles for selected skills: {', '.join(skills_filter)}")
-        role_counts = filtered_df['role'].value_counts()
         if role_counts.empty:
             st.warning("No roles match the selected skills after applying other filters.")
         else:
@@ -382,7 +459,6 @@ else:
             
             st.plotly_chart(fig_role, use_container_width=True)
     else:
-        role_counts = filtered_df['role'].value_counts()
         role_counts_df = role_counts.reset_index()
         role_counts_df.columns = ['role', 'count']
         
@@ -442,26 +518,7 @@ else:
     st.header("Job Postings by Salary Range")
     chart_type_salary = st.selectbox("Select Chart Type for Job Postings by Salary Range", options=["Bar", "Pie", "Line"], index=0, key="chart_type_salary")
 
-    def bucket_salary(salary):
-        if salary == 'Not Disclosed':
-            return 'Not Disclosed'
-        try:
-            if '-' in salary:
-                low, high = map(float, salary.split('-'))
-                avg = (low + high) / 2
-            else:
-                avg = float(salary)
-            if avg < 500000:
-                return '<₹5L'
-            elif avg <= 1000000:
-                return '₹5L-₹10L'
-            else:
-                return '>₹10L'
-        except:
-            return 'Not Disclosed'
-
-    filtered_df['salary_bucket'] = filtered_df['salary'].apply(bucket_salary)
-    salary_counts = filtered_df['salary_bucket'].value_counts()
+    salary_counts = chart_counts['salary_bucket']
     salary_counts_df = salary_counts.reset_index()
     salary_counts_df.columns = ['salary_bucket', 'count']
 
@@ -521,7 +578,7 @@ else:
     st.header("Job Postings by Location")
     chart_type_location = st.selectbox("Select Chart Type for Job Postings by Location", options=["Bar", "Pie", "Line"], index=0, key="chart_type_location")
 
-    location_counts = filtered_df['location'].value_counts().head(10)
+    location_counts = chart_counts['location']
     location_counts_df = location_counts.reset_index()
     location_counts_df.columns = ['location', 'count']
 
@@ -581,9 +638,8 @@ else:
     st.header("Trending Skills")
     chart_type_skills = st.selectbox("Select Chart Type for Trending Skills", options=["Bar", "Pie", "Line"], index=0, key="chart_type_skills")
 
-    if not filtered_df.empty and 'skills' in filtered_df.columns:
-        skills_series = filtered_df['skills'].dropna().str.split(", ").explode().str.strip()
-        skills_counts = skills_series.value_counts().head(10)
+    if 'skills' in df.columns:
+        skills_counts = chart_counts['skills']
         if not skills_counts.empty:
             skills_counts_df = skills_counts.reset_index()
             skills_counts_df.columns = ['skills', 'count']
@@ -648,7 +704,7 @@ else:
     st.header("Top Hiring Companies")
     chart_type_companies = st.selectbox("Select Chart Type for Top Hiring Companies", options=["Bar", "Pie", "Line"], index=0, key="chart_type_companies")
 
-    company_counts = filtered_df['company'].value_counts().head(10)
+    company_counts = chart_counts['company']
     company_counts_df = company_counts.reset_index()
     company_counts_df.columns = ['company', 'count']
 
@@ -706,14 +762,22 @@ else:
 
     # Display job listings
     st.header("Job Listings")
-    st.write(f"Displaying {len(filtered_df)} job listings")
-    st.dataframe(filtered_df[['title', 'company', 'location', 'salary', 'role', 'source', 'skills']])
-
-    # Download filtered data
-    csv = filtered_df.to_csv(index=False).encode('utf-8')
+    st.write(f"Displaying {len(filtered_rows)} job listings")
+    page_size = st.selectbox("Rows per page", options=LISTING_PAGE_SIZES, index=1, key="listing_page_size")
+    page_count = (len(filtered_rows) + page_size - 1) // page_size
+    # Keyed by the filters and page size, so changing either starts again at page 1
+    page = st.number_input("Page", min_value=1, max_value=page_count, value=1, step=1,
+                           key=f"listing_page_{hash((current_filters, page_size))}")
+    page_rows = filtered_rows[(page - 1) * page_size:page * page_size]
+    st.caption(f"Rows {(page - 1) * page_size + 1}-{(page - 1) * page_size + len(page_rows)} (page {page} of {page_count})")
+    st.dataframe(df.iloc[page_rows][LISTING_COLUMNS])
+
+    # Download filtered data. The file is only encoded when the button is
+    # clicked and is not kept in the session afterwards
+    download_format = st.radio("Download format", options=["CSV", "Parquet"], horizontal=True, key="download_format")
     st.download_button(
         label="Download Filtered Data",
-        data=csv,
-        file_name="filtered_job_data.csv",
-        mime="text/csv"
+        data=lambda: encode_rows(df, filtered_rows, download_format),
+        file_name="filtered_job_data.csv" if download_format == "CSV" else "filtered_job_data.parquet",
+        mime="text/csv" if download_format == "CSV" else "application/vnd.apache.parquet"
     )
\ No newline at end of file
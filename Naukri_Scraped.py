@@ -1,18 +1,29 @@
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, WebDriverException
-import pandas as pd
+from selenium.common.exceptions import TimeoutException, WebDriverException, JavascriptException
+import argparse
 import os
+import queue
+import threading
 import time
 import random
 import logging
+from urllib.parse import urlparse
+
+from rate_limit import RateLimiter
+from browser_profile import apply_lean_options, block_resources, TransferStats
+from page_wait import wait_for_cards
+from crawl_metrics import histogram, CrawlMetrics, PageRecord, DEFAULT_METRICS_DIR
+from crawl_state import CrawlState, CheckpointWriter, NoveltyTracker, DEFAULT_STATE_FILE
+from job_sink import JobSink
+from job_sources import job_record
+from crawl_engine import run_crawl, DEFAULT_RATE
+from job_parsers import parse_naukri_cards
 
 # Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(threadName)s - %(message)s')
 
 # Path to ChromeDriver
 CHROMEDRIVER_PATH = "Enter_your_chrome_path"
@@ -32,161 +43,399 @@ locations = [
     "ahmedabad"
 ]
 
-# Create directory for saving data and screenshots
-os.makedirs("Data/clean", exist_ok=True)
-os.makedirs("Data/screenshots", exist_ok=True)
-
-# Set up Chrome options to mimic a real browser
-options = Options()
-options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36")
-options.add_argument("--disable-blink-features=AutomationControlled")
-options.add_argument("--no-sandbox")
-options.add_argument("--disable-dev-shm-usage")
-options.add_argument("--disable-gpu")
-options.add_argument("--enable-unsafe-swiftshader")
-# options.add_argument("--headless")  # Uncomment after testing
-# proxy = "http://your-proxy:port"  # Uncomment and set for proxy support
-# options.add_argument(f"--proxy-server={proxy}")
-
-# Initialize the WebDriver
-service = Service(CHROMEDRIVER_PATH)
-try:
-    driver = webdriver.Chrome(service=service, options=options)
-    logging.info("WebDriver initialized successfully")
-except Exception as e:
-    logging.error(f"Failed to initialize WebDriver: {e}")
-    raise
-
-# Remove navigator.webdriver flag
-driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-
-all_jobs = []
 max_jobs = 30000  # Target up to 30,000 jobs total
 max_pages_per_role_location = 10  # Limit pages per role/location
 jobs_per_page = 20  # Approximate jobs per page on Naukri
 retries = 3
-output_file = "Data/clean/naukri_selenium_fixed.csv"
+output_file = "Data/clean/naukri_selenium_fixed.jsonl"
+base_url = "https://www.naukri.com"
+save_batch_size = 200  # Jobs buffered by the writer before each append
+save_interval = 30.0  # ...or seconds the oldest buffered job may wait
+min_request_interval = 2.0  # Seconds between requests to www.naukri.com across all workers
+SITE = "naukri"  # Key for this scraper's checkpoints in the crawl state
+min_novelty = 0.2  # Stop paginating a role/location once fewer than 20% of a page's cards are new
+
+# Reads every job card on the page in one WebDriver call instead of ~10 per card
+EXTRACT_CARDS_JS = """
+return Array.from(document.getElementsByClassName('srp-jobtuple-wrapper')).map(function (card) {
+    function text(className, fallback) {
+        var element = card.getElementsByClassName(className)[0];
+        return element ? element.innerText.trim() : fallback;
+    }
+    return {
+        title: text('title', 'N/A'),
+        company: text('comp-name', 'N/A'),
+        location: text('locWdth', 'N/A'),
+        salary: text('sal', 'Not Disclosed'),
+        skills: Array.from(card.getElementsByClassName('skill')).map(function (skill) {
+            return skill.innerText.trim();
+        })
+    };
+});
+"""
+
 
-# Function to save jobs incrementally
-def save_jobs(jobs, filename, append=True):
+# Set up Chrome options to mimic a real browser and start a WebDriver
+def create_driver(headless=False, lean=False):
+    options = Options()
+    options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36")
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--enable-unsafe-swiftshader")
+    if lean:
+        apply_lean_options(options)
+    elif headless:
+        options.add_argument("--headless=new")
+    # proxy = "http://your-proxy:port"  # Uncomment and set for proxy support
+    # options.add_argument(f"--proxy-server={proxy}")
+
+    service = Service(CHROMEDRIVER_PATH)
     try:
-        df = pd.DataFrame(jobs)
-        mode = 'a' if append and os.path.exists(filename) else 'w'
-        df.to_csv(filename, index=False, mode=mode, header=not append or mode == 'w')
-        logging.info(f"Saved {len(jobs)} jobs to {filename} (append={append})")
+        driver = webdriver.Chrome(service=service, options=options)
+        logging.info("WebDriver initialized successfully")
     except Exception as e:
-        logging.error(f"Error saving jobs to CSV: {e}")
+        logging.error(f"Failed to initialize WebDriver: {e}")
+        raise
 
-for role in roles:
-    logging.info(f"Starting scraping for role: {role}")
-    for location in locations:
-        if len(all_jobs) >= max_jobs:
-            logging.info(f"Reached global job limit of {max_jobs}")
-            break
-        
-        logging.info(f"Scraping {role} in {location}")
-        for page in range(1, max_pages_per_role_location + 1):
-            if len(all_jobs) >= max_jobs:
+    # Remove navigator.webdriver flag
+    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    if lean:
+        block_resources(driver)
+    return driver
+
+
+# Global job budget shared by all workers
+class JobBudget:
+    def __init__(self, limit):
+        self.remaining = limit
+        self.lock = threading.Lock()
+
+    # Claim up to n jobs from the budget; returns how many were granted
+    def claim(self, n):
+        with self.lock:
+            granted = min(n, self.remaining)
+            self.remaining -= granted
+            return granted
+
+    def exhausted(self):
+        with self.lock:
+            return self.remaining <= 0
+
+
+# Construct URL
+def build_url(role, location, page, base=base_url):
+    url = f"{base}/{role}-jobs-in-{location}?k={role}&l={location}"
+    if page > 1:
+        url += f"&start={(page - 1) * jobs_per_page}"
+    return url
+
+
+# Extract all job cards with a single execute_script call.
+# Returns None if the snippet fails so the caller can fall back to extract_cards_elements.
+def extract_cards_js(driver, role, location):
+    try:
+        cards = driver.execute_script(EXTRACT_CARDS_JS)
+    except (JavascriptException, WebDriverException) as e:
+        logging.warning(f"Batch card extraction failed, falling back to per-element extraction: {e}")
+        return None
+    if not isinstance(cards, list):
+        logging.warning("Batch card extraction returned no list, falling back to per-element extraction")
+        return None
+    return [
+        job_record(role, location, card.get('title', 'N/A'), card.get('company', 'N/A'), card.get('location', 'N/A'),
+                   card.get('salary', 'Not Disclosed'), card.get('skills', []))
+        for card in cards
+    ]
+
+
+# Extract job cards element by element (one WebDriver round-trip per field)
+def extract_cards_elements(driver, role, location):
+    jobs = []
+    for job in driver.find_elements(By.CLASS_NAME, "srp-jobtuple-wrapper"):
+        try:
+            title = job.find_element(By.CLASS_NAME, "title").text.strip() if job.find_elements(By.CLASS_NAME, "title") else "N/A"
+            company = job.find_element(By.CLASS_NAME, "comp-name").text.strip() if job.find_elements(By.CLASS_NAME, "comp-name") else "N/A"
+            location_text = job.find_element(By.CLASS_NAME, "locWdth").text.strip() if job.find_elements(By.CLASS_NAME, "locWdth") else "N/A"
+            salary = job.find_element(By.CLASS_NAME, "sal").text.strip() if job.find_elements(By.CLASS_NAME, "sal") else "Not Disclosed"
+            skills = [skill.text.strip() for skill in job.find_elements(By.CLASS_NAME, "skill")] if job.find_elements(By.CLASS_NAME, "skill") else []
+            jobs.append(job_record(role, location, title, company, location_text, salary, skills))
+        except Exception as e:
+            logging.warning(f"Error parsing job card: {e}")
+            continue
+    return jobs
+
+
+# Scrape one search result page, retrying on timeouts and WebDriver errors
+# Stage timings, retries and the outcome are written to record (a PageRecord).
+def scrape_page(driver, role, location, page, rate_limiter, extract_mode='js', stats=None, record=None):
+    url = build_url(role, location, page)
+    if record is None:
+        record = PageRecord(role, location, page)
+    jobs = []
+    for attempt in range(retries):
+        record.retries = attempt
+        try:
+            rate_limiter.wait(url)
+            logging.info(f"Page {page} (Attempt {attempt + 1}): {url}")
+            with record.stage('navigate'):
+                driver.get(url)
+
+            # Wait until the job cards stop changing (or a CAPTCHA shows up)
+            with record.stage('wait'):
+                cards, waited, captcha = wait_for_cards(driver, ".srp-jobtuple-wrapper", timeout=22,
+                                                        block_selector=".g-recaptcha")
+            if captcha:
+                logging.error(f"CAPTCHA detected on page {page} for {role} in {location}")
+                record.captcha, record.outcome = True, 'captcha'
+                driver.save_screenshot(f"Data/screenshots/captcha_{role}_{location}_page_{page}_attempt_{attempt + 1}.png")
+                break
+            if not cards:
+                raise TimeoutException(f"No job cards after {waited:.1f}s")
+            histogram("time_to_cards", SITE).observe(waited)
+
+            if stats is not None:
+                record.bytes = (stats.record(driver) or {}).get('bytes')
+
+            # Extract job cards, in one script call when possible
+            with record.stage('extract'):
+                jobs = extract_cards_js(driver, role, location) if extract_mode == 'js' else None
+                if jobs is None:
+                    jobs = extract_cards_elements(driver, role, location)
+            record.cards = len(jobs)
+            if not jobs:
+                logging.warning(f"No job cards found on page {page}")
+                record.outcome = 'empty'
+                driver.save_screenshot(f"Data/screenshots/no_cards_{role}_{location}_page_{page}_attempt_{attempt + 1}.png")
+                break
+
+            logging.info(f"Found {len(jobs)} job cards on page {page}")
+            record.outcome = 'ok'
+            break  # Success, move to next page
+
+        except TimeoutException:
+            logging.warning(f"Timeout on page {page}, attempt {attempt + 1}")
+            record.outcome = 'timeout'
+            driver.save_screenshot(f"Data/screenshots/timeout_{role}_{location}_page_{page}_attempt_{attempt + 1}.png")
+            if attempt < retries - 1:
+                time.sleep(random.uniform(5, 10))
+                continue
+            else:
+                logging.error(f"Failed to load page {page} after {retries} attempts")
+                break
+        except WebDriverException as e:
+            logging.error(f"WebDriver error on page {page}: {e}")
+            record.outcome = 'error'
+            if attempt < retries - 1:
+                time.sleep(random.uniform(5, 10))
+                continue
+            else:
                 break
-            
-            # Construct URL
-            url = f"https://www.naukri.com/{role}-jobs-in-{location}?k={role}&l={location}"
-            if page > 1:
-                url += f"&start={(page - 1) * jobs_per_page}"
-            
-            for attempt in range(retries):
-                try:
-                    logging.info(f"Page {page} (Attempt {attempt + 1}): {url}")
-                    driver.get(url)
-                    time.sleep(random.uniform(3, 7))  # Increased delay for large scale
-
-                    # Check for CAPTCHA
-                    captcha = driver.find_elements(By.CLASS_NAME, "g-recaptcha")
-                    if captcha:
-                        logging.error(f"CAPTCHA detected on page {page} for {role} in {location}")
-                        driver.save_screenshot(f"Data/screenshots/captcha_{role}_{location}_page_{page}_attempt_{attempt + 1}.png")
-                        break
-
-                    # Scroll to ensure dynamic content loads
-                    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(random.uniform(1, 3))
-
-                    # Wait for job cards
-                    WebDriverWait(driver, 22).until(
-                        EC.presence_of_all_elements_located((By.CLASS_NAME, "srp-jobtuple-wrapper"))
-                    )
-
-                    # Find job cards
-                    job_cards = driver.find_elements(By.CLASS_NAME, "srp-jobtuple-wrapper")
-                    if not job_cards:
-                        logging.warning(f"No job cards found on page {page}")
-                        driver.save_screenshot(f"Data/screenshots/no_cards_{role}_{location}_page_{page}_attempt_{attempt + 1}.png")
-                        break
-
-                    logging.info(f"Found {len(job_cards)} job cards on page {page}")
-                    for job in job_cards:
-                        try:
-                            title = job.find_element(By.CLASS_NAME, "title").text.strip() if job.find_elements(By.CLASS_NAME, "title") else "N/A"
-                            company = job.find_element(By.CLASS_NAME, "comp-name").text.strip() if job.find_elements(By.CLASS_NAME, "comp-name") else "N/A"
-                            location_text = job.find_element(By.CLASS_NAME, "locWdth").text.strip() if job.find_elements(By.CLASS_NAME, "locWdth") else "N/A"
-                            salary = job.find_element(By.CLASS_NAME, "sal").text.strip() if job.find_elements(By.CLASS_NAME, "sal") else "Not Disclosed"
-                            skills = [skill.text.strip() for skill in job.find_elements(By.CLASS_NAME, "skill")] if job.find_elements(By.CLASS_NAME, "skill") else []
-                            
-                            job_data = {
-                                "Role": role,
-                                "Location": location,
-                                "Title": title,
-                                "Company": company,
-                                "Location_Detail": location_text,
-                                "Salary": salary,
-                                "Skills": skills
-                            }
-                            all_jobs.append(job_data)
-                            
-                            if len(all_jobs) >= max_jobs:
-                                logging.info(f"Reached global job limit of {max_jobs}")
-                                break
-                        
-                        except Exception as e:
-                            logging.warning(f"Error parsing job card: {e}")
-                            continue
-                    
-                    break  # Success, move to next page
-                
-                except TimeoutException:
-                    logging.warning(f"Timeout on page {page}, attempt {attempt + 1}")
-                    driver.save_screenshot(f"Data/screenshots/timeout_{role}_{location}_page_{page}_attempt_{attempt + 1}.png")
-                    if attempt < retries - 1:
-                        time.sleep(random.uniform(5, 10))
-                        continue
-                    else:
-                        logging.error(f"Failed to load page {page} after {retries} attempts")
-                        break
-                except WebDriverException as e:
-                    logging.error(f"WebDriver error on page {page}: {e}")
-                    if attempt < retries - 1:
-                        time.sleep(random.uniform(5, 10))
-                        continue
-                    else:
-                        break
-            
-            if len(all_jobs) >= max_jobs:
+    return jobs
+
+
+# Browser worker: owns one driver and scrapes (role, location, page) items
+# until the queue is empty or the global budget runs out
+def scrape_worker(work_items, results, budget, rate_limiter, headless, extract_mode, state, novelty, lean, stats,
+                  metrics):
+    try:
+        driver = create_driver(headless=headless, lean=lean)
+    except Exception:
+        return
+    try:
+        while not budget.exhausted():
+            try:
+                role, location, page = work_items.get_nowait()
+            except queue.Empty:
                 break
+            if novelty.skip(role, location, page):
+                continue
+            record = metrics.page(role, location, page)
+            jobs = scrape_page(driver, role, location, page, rate_limiter, extract_mode, stats, record)
+            metrics.finish(record)
+            if not jobs:
+                continue  # Failed or empty pages are not checkpointed and get retried next run
+            total = len(jobs)
+            jobs = state.new_jobs(SITE, jobs)
+            novelty.observe(role, location, page, total, len(jobs))
+            granted = budget.claim(len(jobs))
+            if granted < len(jobs):
+                logging.info(f"Reached global job limit of {max_jobs}")
+            results.put(((role, location, page), jobs[:granted], granted == len(jobs)))
+    finally:
+        # Close browser safely
+        try:
+            driver.quit()
+            logging.info("Browser closed successfully")
+        except Exception as e:
+            logging.error(f"Error closing browser: {e}")
+
+
+# Single writer: the only thread that appends to the output file, so pages
+# scraped concurrently never interleave within a save
+def writer_loop(results, writer):
+    while True:
+        try:
+            result = results.get(timeout=1)
+        except queue.Empty:
+            # Flush a batch that has waited save_interval even when no page arrives
+            if writer.sink.due():
+                writer.flush()
+            continue
+        if result is None:
+            break
+        writer.add(*result)
+    # Final save
+    writer.flush()
+
+
+# Crawl task for the async engine: fetch one (role, location, page) over HTTP.
+# Naukri renders most results client-side, so pages without server-rendered
+# cards yield nothing here; the browser workers remain the default.
+async def fetch_page_async(engine, item, base=base_url):
+    role, location, page = item
+    url = build_url(role, location, page, base)
+    result = await engine.fetch(url)
+    if result.status != 200:
+        logging.warning(f"HTTP {result.status} on page {page} for {role} in {location}")
+        return []
+    jobs = parse_naukri_cards(result.text, role, location)
+    logging.info(f"Found {len(jobs)} job cards on page {page} for {role} in {location}")
+    return jobs
+
+
+# Crawl every (role, location, page) concurrently with the asyncio engine.
+# Results arrive on the event loop thread, which acts as the single writer.
+# host_rates overrides the engine's requests per second per host (e.g. for a replay server).
+def run_async(work_items, budget, max_in_flight, writer, novelty, metrics, base=base_url, host_rates=None):
+    async def handle(engine, item):
+        if novelty.skip(*item):
+            return []
+        record = metrics.page(*item)
+        with record.stage('fetch'):
+            jobs = await fetch_page_async(engine, item, base)
+        record.cards = len(jobs)
+        record.outcome = 'ok' if jobs else 'empty'
+        metrics.finish(record)
+        return jobs
+
+    def on_result(item, jobs):
+        if jobs:
+            total = len(jobs)
+            jobs = writer.state.new_jobs(SITE, jobs)
+            novelty.observe(*item, total, len(jobs))
+            granted = budget.claim(len(jobs))
+            writer.add(item, jobs[:granted], granted == len(jobs))
+        if budget.exhausted():
+            logging.info("Reached global job limit")
+            return False
+        return True
+
+    run_crawl(work_items, handle, on_result, max_in_flight=max_in_flight, host_rates=host_rates)
+    writer.flush()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scrape Naukri job postings for each role and location.")
+    parser.add_argument('--workers', type=int, default=1, help="Number of browser workers (default: 1)")
+    parser.add_argument('--headless', action='store_true', help="Run the browsers headless")
+    parser.add_argument('--lean', action='store_true',
+                        help="Headless browsers that block images, media, fonts and analytics requests")
+    parser.add_argument('--max-jobs', type=int, default=max_jobs, help=f"Global job budget (default: {max_jobs})")
+    parser.add_argument('--min-interval', type=float, default=min_request_interval,
+                        help=f"Seconds between requests to the same domain (default: {min_request_interval})")
+    parser.add_argument('--extract', choices=['js', 'elements'], default='js',
+                        help="'js' reads all cards in one script call (falls back to 'elements' on failure)")
+    parser.add_argument('--fetch', choices=['browser', 'async'], default='browser',
+                        help="'async' crawls over HTTP with the concurrent asyncio engine instead of browser workers")
+    parser.add_argument('--max-in-flight', type=int, default=8,
+                        help="Concurrent requests in async mode (default: 8)")
+    parser.add_argument('--base-url', default=base_url,
+                        help=f"Site crawled in async mode, e.g. http://127.0.0.1:8000 (default: {base_url})")
+    parser.add_argument('--rate', type=float, default=DEFAULT_RATE,
+                        help=f"Requests per second to a --base-url other than Naukri (default: {DEFAULT_RATE})")
+    parser.add_argument('--state', default=DEFAULT_STATE_FILE,
+                        help=f"SQLite checkpoint file used to resume an interrupted crawl (default: {DEFAULT_STATE_FILE})")
+    parser.add_argument('--metrics', default=os.path.join(DEFAULT_METRICS_DIR, f"{SITE}_crawl.jsonl"),
+                        help="JSONL file receiving one line per page and per saved batch ('' to disable)")
+    parser.add_argument('--prometheus', default=None,
+                        help="Also keep Prometheus text-format metrics in this file (for node_exporter's textfile collector)")
+    parser.add_argument('--fresh', action='store_true',
+                        help="Start a new crawl of every page; postings saved before are still treated as seen")
+    parser.add_argument('--min-novelty', type=float, default=min_novelty,
+                        help=f"Stop paginating a role/location when the share of new cards on a page drops below this "
+                             f"(default: {min_novelty}; 0 disables)")
+    args = parser.parse_args()
+
+    # Create directory for saving data and screenshots
+    os.makedirs("Data/clean", exist_ok=True)
+    os.makedirs("Data/screenshots", exist_ok=True)
+
+    # Resume from the checkpoints of earlier runs
+    state = CrawlState(args.state)
+    if args.fresh:
+        state.reset(SITE)
+    done = state.completed_pages(SITE)
+    saved_before = state.saved_count(SITE)
+    novelty = NoveltyTracker(state, SITE, args.min_novelty)
+    items = [(role, location, page) for role in roles for location in locations
+             for page in range(1, max_pages_per_role_location + 1)
+             if (role, location, page) not in done and not novelty.skip(role, location, page)]
+    if done:
+        logging.info(f"Resuming: skipping {len(done)} completed pages and {saved_before} saved jobs")
+    budget = JobBudget(args.max_jobs - saved_before)
+    metrics = CrawlMetrics(SITE, args.metrics or None, args.prometheus)
+
+    sink = JobSink(output_file, save_batch_size, save_interval, committed_size=state.committed_size(output_file))
+    writer = CheckpointWriter(state, SITE, sink, metrics)
+
+    if args.fetch == 'async':
+        try:
+            host_rates = None if args.base_url == base_url else {urlparse(args.base_url).netloc: args.rate}
+            run_async(items, budget, args.max_in_flight, writer, novelty, metrics, args.base_url, host_rates)
+        finally:
+            sink.close()
+            state.close()
+            metrics.close()
+        print(metrics.summary())
+        print("✅ Done.")
+        print(f"Scraped {writer.saved} jobs (total saved to {output_file}).")
+        return
+
+    work_items = queue.Queue()
+    for item in items:
+        work_items.put(item)
 
-        # Save jobs incrementally after each location
-        if all_jobs:
-            save_jobs(all_jobs, output_file, append=True)
-            all_jobs = []  # Clear memory
+    rate_limiter = RateLimiter(args.min_interval, jitter=args.min_interval / 2)
+    results = queue.Queue()
+    stats = TransferStats()
 
-    if len(all_jobs) >= max_jobs:
-        break
+    writer_thread = threading.Thread(target=writer_loop, args=(results, writer), name="writer")
+    writer_thread.start()
+    workers = [
+        threading.Thread(target=scrape_worker,
+                         args=(work_items, results, budget, rate_limiter, args.headless, args.extract, state, novelty,
+                               args.lean, stats, metrics),
+                         name=f"worker-{i + 1}")
+        for i in range(args.workers)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    results.put(None)
+    writer_thread.join()
+    sink.close()
+    state.close()
+    metrics.close()
+    logging.info(f"Browser transfer: {stats.summary()}")
+    logging.info(f"Time to cards: {histogram('time_to_cards', SITE).summary()}")
+    print(metrics.summary())
 
-# Close the browser
-driver.quit()
+    print("✅ Done.")
+    print(f"Scraped {writer.saved} jobs (total saved to {output_file}).")
 
-# Final save (if any jobs remain)
-if all_jobs:
-    save_jobs(all_jobs, output_file, append=True)
 
-print("✅ Done.")
-print(f"Scraped {len(all_jobs)} jobs (total saved to {output_file}).")
+if __name__ == '__main__':
+    main()
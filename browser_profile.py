@@ -0,0 +1,80 @@
+import logging
+import threading
+
+from selenium.common.exceptions import WebDriverException
+
+# "Lean" Chrome profile shared by Indeed_Scraped.py and Naukri_Scraped.py:
+# headless, no images, and requests for media, fonts and analytics blocked
+# through the DevTools protocol, so a search page only downloads the HTML and
+# the scripts that render the job cards.
+
+# Network.setBlockedURLs patterns (* matches any run of characters)
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.mp4", "*.webm", "*.mp3",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*googlesyndication.com*", "*facebook.net*", "*hotjar.com*", "*clarity.ms*",
+    "*newrelic.com*", "*nr-data.net*", "*bing.com/bat*",
+]
+
+# Bytes fetched for the current document and its subresources. transferSize is
+# 0 for cross-origin resources without Timing-Allow-Origin, so this slightly
+# undercounts third-party traffic; it is meant for before/after comparisons.
+PAGE_STATS_JS = """
+var nav = performance.getEntriesByType('navigation')[0];
+var bytes = nav ? nav.transferSize : 0;
+performance.getEntriesByType('resource').forEach(function (entry) { bytes += entry.transferSize || 0; });
+return {bytes: bytes, load_ms: nav ? nav.duration : 0, resources: performance.getEntriesByType('resource').length};
+"""
+
+
+# Add the lean settings to a ChromeOptions instance
+def apply_lean_options(options):
+    options.add_argument("--headless=new")
+    options.add_argument("--window-size=1366,900")
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+
+
+# Block heavy and tracking requests for every page the driver loads from now on
+def block_resources(driver):
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        logging.info(f"Blocking {len(BLOCKED_URL_PATTERNS)} resource patterns")
+    except WebDriverException as e:
+        logging.warning(f"Could not enable resource blocking: {e}")
+
+
+# Running totals of bytes and load time per page, shared by all workers
+class TransferStats:
+    def __init__(self):
+        self.pages = 0
+        self.bytes = 0
+        self.load_ms = 0.0
+        self.lock = threading.Lock()
+
+    # Read the transfer size of the page currently loaded in driver
+    def record(self, driver):
+        try:
+            stats = driver.execute_script(PAGE_STATS_JS)
+        except WebDriverException as e:
+            logging.warning(f"Could not read page transfer stats: {e}")
+            return None
+        if not isinstance(stats, dict):
+            return None
+        with self.lock:
+            self.pages += 1
+            self.bytes += stats.get('bytes') or 0
+            self.load_ms += stats.get('load_ms') or 0
+        logging.info(f"Page transfer: {(stats.get('bytes') or 0) / 1024:.0f} KB in {stats.get('resources')} resources, "
+                     f"loaded in {(stats.get('load_ms') or 0) / 1000:.1f}s")
+        return stats
+
+    def summary(self):
+        with self.lock:
+            if not self.pages:
+                return "No page transfer stats recorded"
+            return (f"{self.pages} pages, {self.bytes / self.pages / 1024:.0f} KB and "
+                    f"{self.load_ms / self.pages / 1000:.1f}s load per page on average")
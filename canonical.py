@@ -0,0 +1,119 @@
+import re
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+# Canonical location and company names. Scraped strings such as "Bengaluru",
+# "Bangalore Urban", "Hybrid work in Bengaluru, Karnataka" or
+# "Wipro Limited" / "Wipro" name the same city or employer; they are resolved
+# to one canonical name each so charts and group-bys count them together.
+# Each distinct raw string is resolved once (lru_cache), and whole columns
+# are returned as categoricals, i.e. integer codes into the canonical names.
+
+UNKNOWN = 'Unknown'
+
+# Alias (lowercase) -> canonical city
+LOCATION_ALIASES = {
+    'bengaluru': 'Bangalore',
+    'bengaluru urban': 'Bangalore',
+    'bangalore urban': 'Bangalore',
+    'bangalore rural': 'Bangalore',
+    'gurugram': 'Gurgaon',
+    'new delhi': 'Delhi',
+    'delhi ncr': 'Delhi',
+    'ncr': 'Delhi',
+    'bombay': 'Mumbai',
+    'mumbai suburban': 'Mumbai',
+    'greater mumbai': 'Mumbai',
+    'madras': 'Chennai',
+    'calcutta': 'Kolkata',
+    'poona': 'Pune',
+    'secunderabad': 'Hyderabad',
+    'greater noida': 'Noida',
+    'gautam budh nagar': 'Noida',
+    'amdavad': 'Ahmedabad',
+    'remote': 'Remote',
+    'work from home': 'Remote',
+    'wfh': 'Remote',
+}
+CITIES = ['Bangalore', 'Hyderabad', 'Pune', 'Mumbai', 'Chennai', 'Gurgaon', 'Noida', 'Ahmedabad', 'Kolkata', 'Delhi']
+
+# Alias (lowercase, legal suffixes removed) -> canonical company
+COMPANY_ALIASES = {
+    'tcs': 'Tata Consultancy Services',
+    'jpmorganchase': 'Jpmorgan Chase',
+    'jp morgan chase': 'Jpmorgan Chase',
+    'ernst & young': 'Ey',
+    'pricewaterhousecoopers': 'Pwc',
+    'ibm india': 'Ibm',
+}
+
+# Legal-form words that differ between listings of the same employer
+COMPANY_SUFFIXES = {
+    'pvt', 'private', 'ltd', 'limited', 'llp', 'inc', 'incorporated', 'corp', 'corporation',
+    'co', 'company', 'plc', 'pte', 'gmbh', 'llc', 'the',
+}
+# Words dropped from the end of a company name; '' covers a lone "," or "&"
+_TRAILING_WORDS = COMPANY_SUFFIXES | {''}
+
+_LOCATIONS = {**{city.lower(): city for city in CITIES}, **LOCATION_ALIASES}
+# "Hybrid work in Pune", "Remote in Kolkata", "Hybrid - Gurugram"
+_LOCATION_PREFIX = re.compile(r'^(?:hybrid(?:\s+work)?|remote|on-?site)\s*(?:\bin\b|-|:)\s*', re.IGNORECASE)
+# Parts of multi-city or "Area, City, State" strings
+_LOCATION_PARTS = re.compile(r'\s*(?:[,/;|()]|\s-\s)\s*')
+
+
+# Canonical city for a raw location: the first part that is a known city or
+# alias ("Salt Lake, Kolkata, West Bengal" -> "Kolkata"), otherwise the first
+# part title-cased
+@lru_cache(maxsize=None)
+def canonical_location(location):
+    if location is None:
+        return UNKNOWN
+    text = ' '.join(str(location).split())
+    if not text or text.lower() in ('nan', 'n/a'):
+        return UNKNOWN
+    text = _LOCATION_PREFIX.sub('', text)
+    parts = [part for part in _LOCATION_PARTS.split(text) if part]
+    for part in parts:
+        city = _LOCATIONS.get(part.lower())
+        if city:
+            return city
+    return parts[0].title() if parts else UNKNOWN
+
+
+# Canonical company: title-cased, trailing legal suffixes dropped
+# ("Epam Systems, Inc." -> "Epam Systems"), then known aliases resolved
+@lru_cache(maxsize=None)
+def canonical_company(company):
+    if company is None:
+        return UNKNOWN
+    words = ' '.join(str(company).split()).title().split(' ')
+    if not words[0] or words[0].lower() in ('nan', 'n/a'):
+        return UNKNOWN
+    while len(words) > 1 and words[-1].strip(',.()&').lower() in _TRAILING_WORDS:
+        words.pop()
+    name = ' '.join(words).rstrip(',.&') or words[0]
+    return COMPANY_ALIASES.get(name.lower(), name)
+
+
+# Resolve a column with one of the functions above. Values are factorized
+# first, so resolve runs once per distinct string; the result is a categorical
+# whose integer codes index the sorted canonical names.
+def canonicalize(values, resolve):
+    values = pd.Series(values)
+    codes, uniques = pd.factorize(values)
+    # Missing values get code -1, which picks the last entry: resolve(None)
+    names = [resolve(value) for value in uniques] + [resolve(None)]
+    categories, name_codes = np.unique(names, return_inverse=True)
+    return pd.Series(pd.Categorical.from_codes(name_codes[codes], categories),
+                     index=values.index, name=values.name)
+
+
+def canonical_locations(values):
+    return canonicalize(values, canonical_location)
+
+
+def canonical_companies(values):
+    return canonicalize(values, canonical_company)
@@ -1,41 +1,37 @@
 import pandas as pd
+import numpy as np
+import argparse
+import io
 import json
-import re
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 
-# Load Naukri CSV data
 try:
-    naukri_df = pd.read_csv('naukri_selenium_fixed.csv')
-    naukri_df['source'] = 'Naukri'
-    print("Naukri CSV columns:", naukri_df.columns.tolist())
-    print(f"Naukri records: {len(naukri_df)}")
-except FileNotFoundError:
-    print("Error: 'naukri_selenium_fixed.csv' not found in")
-    exit(1)
-
-# Load Indeed JSON data (JSONL format)
-indeed_data = []
-try:
-    with open('indeed_selenium_fixed.json', 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                try:
-                    indeed_data.append(json.loads(line))
-                except json.JSONDecodeError as e:
-                    print(f"Skipping invalid JSON line: {e}")
-                    continue
-except FileNotFoundError:
-    print("Error: 'indeed_selenium_fixed.json' not found in ")
-    exit(1)
-
-if not indeed_data:
-    print("Error: No valid data found in 'indeed_selenium_fixed.json'")
-    exit(1)
-
-indeed_df = pd.DataFrame(indeed_data)
-indeed_df['source'] = 'Indeed'
-print("Indeed JSON columns:", indeed_df.columns.tolist())
-print(f"Indeed records: {len(indeed_df)}")
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+from salary_parser import parse_salary, salary_label, SALARY_COLUMNS
+from job_store import write_store, append_store
+from job_cube import build_store_cube, write_cube, cube_path
+from job_sources import READERS
+from canonical import canonical_locations, canonical_companies
+
+CLEANED_FILE = 'cleaned_job_data.csv'
+STORE_PATH = 'cleaned_job_data.parquet'
+CUBE_PATH = cube_path(STORE_PATH)
+DUPLICATES_FILE = 'duplicates.csv'
+
+# Incremental mode bookkeeping: byte offsets already consumed per raw file,
+# and a sorted array of hashes of every dedup key already in the cleaned output
+STATE_FILE = 'cleaning_state.json'
+KEY_INDEX_FILE = 'cleaned_keys.npy'
+
+# Raw records cleaned and written per batch; bounds peak memory
+DEFAULT_CHUNKSIZE = 100000
+
+DEDUP_KEY = ['title', 'company', 'location', 'source', 'salary']
 
 # Standardize column names
 column_mapping = {
@@ -47,46 +43,47 @@ column_mapping = {
     'Skills': 'skills'
 }
 
-# Rename columns for consistency
-naukri_df = naukri_df.rename(columns={k: v for k, v in column_mapping.items() if k in naukri_df.columns})
-indeed_df = indeed_df.rename(columns={k: v for k, v in column_mapping.items() if k in indeed_df.columns})
-
-# Ensure both DataFrames have the same columns
 common_columns = ['title', 'company', 'location', 'salary', 'description', 'role', 'skills', 'source']
-naukri_df = naukri_df.reindex(columns=common_columns)
-indeed_df = indeed_df.reindex(columns=common_columns)
 
-# Merge the DataFrames
-merged_df = pd.concat([naukri_df, indeed_df], ignore_index=True)
-print(f"Total records after merge: {len(merged_df)}")
 
-# Debug column types
-print("Merged DataFrame column types:\n", merged_df.dtypes)
+# Stream the complete lines of a raw file from a byte offset (never before start,
+# e.g. the end of a CSV header) in batches of up to batch_size lines.
+# Yields each batch with the offset just past its last line; a trailing line the
+# scraper is still writing is left for the next run.
+def iter_line_batches(file_path, offset, batch_size, start=0):
+    if os.path.getsize(file_path) < offset:
+        print(f"'{file_path}' is smaller than the saved offset, reading it from the start")
+        offset = start
+    offset = max(offset, start)
+    with open(file_path, 'rb') as f:
+        f.seek(offset)
+        batch = []
+        for line in f:
+            if not line.endswith(b'\n'):
+                break
+            batch.append(line)
+            offset += len(line)
+            if len(batch) >= batch_size:
+                yield batch, offset
+                batch = []
+        if batch:
+            yield batch, offset
+
+
+# Column names from the header line of a raw CSV file, and the header length in bytes
+def read_csv_header(file_path):
+    with open(file_path, 'rb') as f:
+        header = f.readline()
+    return pd.read_csv(io.BytesIO(header), nrows=0).columns.tolist(), len(header)
 
-# Clean the data
-def clean_salary(salary):
-    if pd.isna(salary) or salary == 'Not Disclosed' or not salary:
-        return 'Not Disclosed'
-    salary = str(salary).lower().replace('₹', '').replace('$', '').replace(',', '').strip()
-    if not re.search(r'\d', salary):
-        return 'Not Disclosed'
-    match = re.match(r'(\d+\.?\d*)\s*-\s*(\d+\.?\d*)', salary)
-    if match:
-        low, high = match.group(1), match.group(2)
-        if 'lac' in salary:
-            low = str(float(low) * 100000)
-            high = str(float(high) * 100000)
-        return f"{low}-{high}"
-    match = re.match(r'(\d+\.?\d*)', salary)
-    if match:
-        return match.group(1)
-    return 'Not Disclosed'
-
-def clean_location(location):
-    if pd.isna(location):
-        return 'Unknown'
-    return ' '.join(str(location).split()).title()
 
+# Rename columns for consistency and ensure both sources have the same columns
+def standardize(df):
+    df = df.rename(columns={k: v for k, v in column_mapping.items() if k in df.columns})
+    return df.reindex(columns=common_columns)
+
+
+# Clean the data
 def clean_skills(skills):
     if pd.isna(skills) or skills == [] or skills == '[]' or not skills:
         return 'None'
@@ -99,29 +96,269 @@ def clean_description(description):
         return 'No description'
     return str(description).strip()
 
+
 # Apply cleaning functions
-merged_df['salary'] = merged_df['salary'].apply(clean_salary)
-merged_df['location'] = merged_df['location'].apply(clean_location)
-merged_df['title'] = merged_df['title'].astype(str).str.strip().str.title()
-merged_df['company'] = merged_df['company'].astype(str).str.strip().str.title()
-merged_df['description'] = merged_df['description'].apply(clean_description)
-merged_df['role'] = merged_df['role'].astype(str).str.strip().str.title().fillna('Unknown')
-# merged_df['skills'] = merged_df['skills'].apply(clean_skills)
-
-# Handle missing values
-merged_df.fillna({'salary': 'Not Disclosed', 'location': 'Unknown', 'description': 'No description', 'role': 'Unknown', 'skills': 'None'}, inplace=True)
-
-# Identify and save duplicates
-duplicates = merged_df[merged_df.duplicated(subset=['title', 'company', 'location', 'source', 'salary'], keep=False)]
-duplicates.to_csv('duplicates.csv', index=False)
-print(f"Number of duplicate records (including salary): {len(duplicates)}")
-print(f"Naukri duplicates: {len(duplicates[duplicates['source'] == 'Naukri'])}")
-print(f"Indeed duplicates: {len(duplicates[duplicates['source'] == 'Indeed'])}")
-
-# Remove duplicates
-merged_df = merged_df.drop_duplicates(subset=['title', 'company', 'location', 'source', 'salary'], keep='first')
-
-# Save cleaned data
-merged_df.to_csv('cleaned_job_data.csv', index=False)
-
-print(f"Cleaned data saved to 'cleaned_job_data.csv' with {len(merged_df)} records.")
+def clean_jobs(merged_df):
+    merged_df = merged_df.copy()
+    # Parse salaries once into numeric yearly columns; the text label is derived from them
+    salary_parsed = parse_salary(merged_df['salary'])
+    merged_df[SALARY_COLUMNS] = salary_parsed
+    merged_df['salary'] = salary_label(salary_parsed)
+    # Aliases ("Bengaluru", "Wipro Limited") are resolved to canonical names, kept as categorical codes
+    merged_df['location'] = canonical_locations(merged_df['location'])
+    merged_df['title'] = merged_df['title'].astype(str).str.strip().str.title()
+    merged_df['company'] = canonical_companies(merged_df['company'])
+    merged_df['description'] = merged_df['description'].apply(clean_description)
+    merged_df['role'] = merged_df['role'].astype(str).str.strip().str.title().fillna('Unknown')
+    # merged_df['skills'] = merged_df['skills'].apply(clean_skills)
+
+    # Handle missing values
+    merged_df.fillna({'salary': 'Not Disclosed', 'location': 'Unknown', 'description': 'No description', 'role': 'Unknown', 'skills': 'None'}, inplace=True)
+    return merged_df
+
+
+# 64-bit hash of the dedup key of every row
+def hash_keys(df):
+    return pd.util.hash_pandas_object(df[DEDUP_KEY].astype(str), index=False).to_numpy(dtype=np.uint64)
+
+
+# Parse, clean and hash one batch of raw lines. This is the unit of work
+# handed to worker processes with --workers, so it must not touch shared state.
+def clean_chunk(parse_lines, lines, names):
+    raw_df = parse_lines(lines, names)
+    cleaned_df = clean_jobs(standardize(raw_df))
+    return cleaned_df, hash_keys(cleaned_df), len(raw_df)
+
+
+# Stream cleaned chunks of a raw file in input order, with the offset reached after each.
+# With an executor, up to two chunks per worker are cleaned in parallel while
+# results are still yielded in order, so the output matches the serial path.
+def iter_cleaned_chunks(file_path, parse_lines, has_header, offset, chunksize, executor=None, workers=1):
+    names, start = read_csv_header(file_path) if has_header else (None, 0)
+    batches = iter_line_batches(file_path, offset, chunksize, start=start)
+    if executor is None:
+        for lines, end_offset in batches:
+            yield clean_chunk(parse_lines, lines, names) + (end_offset,)
+        return
+
+    pending = deque()
+    for lines, end_offset in batches:
+        pending.append((executor.submit(clean_chunk, parse_lines, lines, names), end_offset))
+        if len(pending) >= 2 * workers:
+            future, done_offset = pending.popleft()
+            yield future.result() + (done_offset,)
+    while pending:
+        future, done_offset = pending.popleft()
+        yield future.result() + (done_offset,)
+
+
+# Set of dedup key hashes kept as sorted uint64 runs (8 bytes per key).
+# New batches become small runs that are merged into larger ones as they grow,
+# so adding a batch does not copy the whole index every time.
+class KeyIndex:
+    def __init__(self, keys=None):
+        self.runs = []
+        if keys is not None and len(keys):
+            self.runs.append(keys)
+
+    def __len__(self):
+        return sum(len(run) for run in self.runs)
+
+    # True for every hash already in the index
+    def contains(self, key_hashes):
+        found = np.zeros(len(key_hashes), dtype=bool)
+        for run in self.runs:
+            positions = np.minimum(np.searchsorted(run, key_hashes), len(run) - 1)
+            found |= np.asarray(run[positions]) == key_hashes
+        return found
+
+    def add(self, key_hashes):
+        if len(key_hashes) == 0:
+            return
+        self.runs.append(np.unique(key_hashes))
+        while len(self.runs) > 1 and len(self.runs[-2]) <= 2 * len(self.runs[-1]):
+            newest = self.runs.pop()
+            self.runs[-1] = np.union1d(self.runs[-1], newest)
+
+    def to_array(self):
+        if not self.runs:
+            return np.empty(0, dtype=np.uint64)
+        return np.unique(np.concatenate([np.asarray(run) for run in self.runs]))
+
+
+def load_state():
+    if not os.path.exists(STATE_FILE):
+        return {}
+    with open(STATE_FILE, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+# State and key index are written to a temporary file and moved into place,
+# so an interrupted run leaves either the previous or the new version
+def save_state(state):
+    tmp_path = STATE_FILE + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=2)
+    os.replace(tmp_path, STATE_FILE)
+
+# Loaded into memory rather than memory-mapped: the file is replaced at every
+# checkpoint, which fails on Windows while it is still mapped
+def load_key_index():
+    if not os.path.exists(KEY_INDEX_FILE):
+        return KeyIndex()
+    return KeyIndex(np.load(KEY_INDEX_FILE))
+
+def save_key_index(key_index):
+    tmp_path = KEY_INDEX_FILE + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        np.save(f, key_index.to_array())
+    os.replace(tmp_path, KEY_INDEX_FILE)
+
+# Record the offsets and keys of the records written so far. Called after every
+# written chunk; the keys go first, so a run interrupted between the two saves
+# re-reads the chunk but drops its records as duplicates instead of appending them again.
+def save_checkpoint(state, key_index):
+    save_key_index(key_index)
+    save_state(state)
+
+
+# Writes cleaned records and dropped duplicates batch by batch, either
+# replacing the previous output (full rebuild) or appending to it
+class BatchWriter:
+    def __init__(self, append):
+        self.append = append
+        self.written = 0
+        self.duplicates = 0
+        self.started = False
+        self.duplicates_started = False
+
+    def write(self, cleaned_df):
+        if cleaned_df.empty:
+            return
+        if self.append or self.started:
+            cleaned_df.to_csv(CLEANED_FILE, index=False, mode='a', header=False)
+            append_store(cleaned_df, STORE_PATH)
+        else:
+            cleaned_df.to_csv(CLEANED_FILE, index=False)
+            write_store(cleaned_df, STORE_PATH)
+        self.started = True
+        self.written += len(cleaned_df)
+
+    def write_duplicates(self, duplicates_df):
+        if duplicates_df.empty:
+            return
+        duplicates_df.to_csv(DUPLICATES_FILE, index=False, mode='a' if self.duplicates_started else 'w',
+                             header=not self.duplicates_started)
+        self.duplicates_started = True
+        self.duplicates += len(duplicates_df)
+
+
+# Peak resident memory of this process in MB, or None where unsupported
+def peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    return peak / (1024 * 1024) if os.uname().sysname == 'Darwin' else peak / 1024
+
+
+# Global dedup stage: walk the cleaned chunks of every source reader in order,
+# drop records whose key was already written and write the rest. Returns the
+# number of duplicates per source; the per-file offsets in state and the key
+# index are checkpointed after every chunk.
+def clean_sources(readers, state, key_index, writer, chunksize, executor=None, workers=1):
+    duplicate_counts = {}
+    for reader in readers:
+        source, file_path = reader.source, reader.path
+        records = 0
+        duplicate_counts.setdefault(source, 0)
+        chunks = iter_cleaned_chunks(file_path, reader.parse, reader.has_header, state.get(file_path, 0), chunksize,
+                                     executor, workers)
+        for cleaned_df, key_hashes, raw_records, end_offset in chunks:
+            records += raw_records
+
+            # A record is a duplicate if its key was written before or appears earlier in this chunk
+            is_duplicate = key_index.contains(key_hashes) | cleaned_df.duplicated(subset=DEDUP_KEY, keep='first').to_numpy()
+            key_index.add(key_hashes[~is_duplicate])
+
+            writer.write(cleaned_df[~is_duplicate])
+            writer.write_duplicates(cleaned_df[is_duplicate])
+            duplicate_counts[source] += int(is_duplicate.sum())
+            state[file_path] = end_offset
+            save_checkpoint(state, key_index)
+        print(f"{source} records: {records}")
+    return duplicate_counts
+
+
+# Clean the raw files chunk by chunk. A full rebuild starts from the beginning of
+# both files; incremental mode resumes from the saved offsets and appends only
+# records whose dedup key has not been written before. With workers > 1 the
+# chunks are cleaned in a process pool and deduplicated here in input order.
+def run(incremental=False, chunksize=DEFAULT_CHUNKSIZE, workers=1):
+    readers = [reader for reader in READERS if os.path.exists(reader.path)]
+    for source in dict.fromkeys(reader.source for reader in READERS if reader.required):
+        if not any(reader.source == source for reader in readers):
+            paths = [reader.path for reader in READERS if reader.source == source]
+            print(f"Error: '{' or '.join(paths)}' not found")
+            exit(1)
+
+    state = load_state() if incremental else {}
+    if incremental and (not state or not os.path.exists(CLEANED_FILE) or not os.path.exists(KEY_INDEX_FILE)):
+        print("No previous cleaning state found, running a full rebuild")
+        incremental = False
+        state = {}
+
+    key_index = load_key_index() if incremental else KeyIndex()
+    if not incremental and os.path.exists(STATE_FILE):
+        # The old checkpoint describes output this rebuild replaces; until the
+        # first chunk is checkpointed an interrupted run must rebuild again
+        os.remove(STATE_FILE)
+    writer = BatchWriter(append=incremental)
+    if os.path.exists(DUPLICATES_FILE):
+        os.remove(DUPLICATES_FILE)
+
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        duplicate_counts = clean_sources(readers, state, key_index, writer, chunksize, executor, workers)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    # Identify and save duplicates
+    print(f"Number of duplicate records removed (including salary): {writer.duplicates}")
+    for source, count in duplicate_counts.items():
+        print(f"{source} duplicates: {count}")
+
+    if incremental:
+        print(f"Appended {writer.written} new records to '{CLEANED_FILE}' and '{STORE_PATH}'.")
+    else:
+        print(f"Cleaned data saved to '{CLEANED_FILE}' with {writer.written} records.")
+        print(f"Columnar store saved to '{STORE_PATH}'")
+
+    # Rebuild the dashboard's aggregate cube over the whole store, old and new
+    # records, one store part at a time; a run that wrote nothing keeps the cube
+    if os.path.isdir(STORE_PATH) and (writer.written or not os.path.isdir(CUBE_PATH)):
+        cube = build_store_cube(STORE_PATH)
+        write_cube(cube, CUBE_PATH)
+        print(f"Aggregate cube saved to '{CUBE_PATH}' with {len(cube['cells'])} cells")
+    elif os.path.isdir(STORE_PATH):
+        print(f"No new records, aggregate cube '{CUBE_PATH}' is up to date")
+
+    peak = peak_rss_mb()
+    if peak is not None:
+        print(f"Peak memory usage: {peak:.1f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Clean and merge the scraped Naukri and Indeed job data.")
+    parser.add_argument('--incremental', action='store_true',
+                        help="Only clean records appended to the raw files since the last run")
+    parser.add_argument('--chunksize', type=int, default=DEFAULT_CHUNKSIZE,
+                        help=f"Raw records cleaned and written per batch (default: {DEFAULT_CHUNKSIZE})")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Clean chunks in this many processes (default: 1, no pool)")
+    args = parser.parse_args()
+    run(incremental=args.incremental, chunksize=args.chunksize, workers=args.workers)
+
+
+if __name__ == '__main__':
+    main()
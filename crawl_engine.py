@@ -0,0 +1,92 @@
+import asyncio
+import logging
+import random
+from urllib.parse import urlparse
+
+import requests
+
+from rate_limit import AsyncTokenBucket
+
+# asyncio crawl engine shared by Indeed_Scraped.py and Naukri_Scraped.py.
+# Up to max_in_flight pages are fetched concurrently; each host has its own
+# token bucket, and the jittered politeness delay of one request overlaps with
+# the others instead of blocking the whole crawl.
+
+# Requests per second allowed per host
+DEFAULT_HOST_RATES = {
+    'in.indeed.com': 0.5,
+    'www.indeed.com': 0.5,
+    'www.naukri.com': 0.5,
+}
+DEFAULT_RATE = 0.5
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36"
+
+
+class FetchResult:
+    def __init__(self, url, status, text, final_url):
+        self.url = url
+        self.status = status
+        self.text = text
+        self.final_url = final_url
+
+
+class CrawlEngine:
+    def __init__(self, host_rates=None, max_in_flight=8, politeness_delay=(0.5, 2.0), timeout=20):
+        self.host_rates = dict(DEFAULT_HOST_RATES if host_rates is None else host_rates)
+        self.max_in_flight = max_in_flight
+        self.politeness_delay = politeness_delay
+        self.timeout = timeout
+        self.buckets = {}
+        self.session = requests.Session()
+        self.session.headers.update({"User-Agent": USER_AGENT, "Accept-Language": "en-US,en;q=0.9"})
+        adapter = requests.adapters.HTTPAdapter(pool_connections=len(self.host_rates) + 1, pool_maxsize=max_in_flight)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def bucket_for(self, url):
+        host = urlparse(url).netloc
+        if host not in self.buckets:
+            self.buckets[host] = AsyncTokenBucket(self.host_rates.get(host, DEFAULT_RATE))
+        return self.buckets[host]
+
+    # Fetch one URL once its host bucket allows it. The blocking HTTP call
+    # runs in a worker thread so other requests keep going meanwhile.
+    async def fetch(self, url):
+        await asyncio.sleep(random.uniform(*self.politeness_delay))
+        await self.bucket_for(url).acquire()
+        response = await asyncio.to_thread(self.session.get, url, timeout=self.timeout)
+        return FetchResult(url, response.status_code, response.text, response.url)
+
+    # Run handle(engine, item) for every item with at most max_in_flight running.
+    # on_result(item, result) is called in completion order; returning False
+    # from it stops scheduling further items (e.g. when a job budget is used up).
+    async def run(self, items, handle, on_result):
+        semaphore = asyncio.Semaphore(self.max_in_flight)
+        stop = asyncio.Event()
+
+        async def run_one(item):
+            async with semaphore:
+                if stop.is_set():
+                    return
+                try:
+                    result = await handle(self, item)
+                except Exception as e:
+                    logging.error(f"Crawl task {item} failed: {e}")
+                    return
+                if on_result(item, result) is False:
+                    stop.set()
+
+        await asyncio.gather(*(run_one(item) for item in items))
+
+    def close(self):
+        self.session.close()
+
+
+# Run a crawl to completion from synchronous code
+def run_crawl(items, handle, on_result, **engine_options):
+    engine = CrawlEngine(**engine_options)
+    try:
+        asyncio.run(engine.run(items, handle, on_result))
+    finally:
+        engine.close()
@@ -0,0 +1,202 @@
+import bisect
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+# Crawl measurements shared by the scrapers. Histograms use fixed buckets so
+# they stay small for arbitrarily long crawls.
+
+# Bucket upper bounds in seconds for time-to-cards
+SECONDS_BUCKETS = [0.5, 1, 1.5, 2, 3, 5, 8, 13, 21, 30]
+
+
+class Histogram:
+    def __init__(self, buckets=SECONDS_BUCKETS):
+        self.buckets = list(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # Last slot counts values above the top bucket
+        self.count = 0
+        self.sum = 0.0
+        self.lock = threading.Lock()
+
+    def observe(self, value):
+        with self.lock:
+            self.counts[bisect.bisect_left(self.buckets, value)] += 1
+            self.count += 1
+            self.sum += value
+
+    # Upper bound of the bucket holding quantile q (0-1)
+    def quantile(self, q):
+        with self.lock:
+            if not self.count:
+                return None
+            rank = q * self.count
+            seen = 0
+            for bound, n in zip(self.buckets + [float('inf')], self.counts):
+                seen += n
+                if seen >= rank:
+                    return bound
+        return float('inf')
+
+    def summary(self):
+        if not self.count:
+            return "no observations"
+        return (f"n={self.count} mean={self.sum / self.count:.2f}s "
+                f"p50<={self.quantile(0.5)}s p90<={self.quantile(0.9)}s p99<={self.quantile(0.99)}s")
+
+
+_histograms = {}
+_histograms_lock = threading.Lock()
+
+
+# Named histogram, created on first use, e.g. histogram("time_to_cards", "naukri")
+def histogram(name, site):
+    with _histograms_lock:
+        if (name, site) not in _histograms:
+            _histograms[(name, site)] = Histogram()
+        return _histograms[(name, site)]
+
+
+# Pipeline stages timed for every page; "fetch" is the HTTP-only equivalent
+# of navigate + wait, and "save" is timed per written batch
+STAGES = ['navigate', 'wait', 'extract', 'fetch', 'save']
+DEFAULT_METRICS_DIR = "Data/metrics"
+
+
+# Timings and outcome of one (role, location, page) unit
+class PageRecord:
+    def __init__(self, role, location, page):
+        self.role = role
+        self.location = location
+        self.page = page
+        self.started = time.monotonic()
+        self.timings = {}
+        self.cards = 0
+        self.retries = 0
+        self.captcha = False
+        self.bytes = None
+        self.outcome = 'ok'
+
+    @contextmanager
+    def stage(self, name):
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.timings[name] = self.timings.get(name, 0.0) + time.monotonic() - start
+
+
+# Per-run crawl metrics: one JSONL line per page and per saved batch, running
+# counters and per-stage histograms, an optional Prometheus text-format file
+# (rewritten every prom_every pages, for node_exporter's textfile collector)
+# and a summary at the end of the run. Safe to share between worker threads.
+class CrawlMetrics:
+    def __init__(self, site, jsonl_path=None, prom_path=None, prom_every=10):
+        self.site = site
+        self.jsonl_path = jsonl_path
+        self.prom_path = prom_path
+        self.prom_every = prom_every
+        self.started = time.monotonic()
+        self.lock = threading.Lock()
+        self.counters = {'pages': 0, 'cards': 0, 'jobs_saved': 0, 'retries': 0, 'captcha': 0, 'failed_pages': 0}
+        self.stages = {name: Histogram() for name in STAGES}
+        self.jsonl = None
+        if jsonl_path:
+            os.makedirs(os.path.dirname(jsonl_path) or '.', exist_ok=True)
+            self.jsonl = open(jsonl_path, 'a', encoding='utf-8')
+
+    def page(self, role, location, page):
+        return PageRecord(role, location, page)
+
+    def _emit(self, event):
+        if self.jsonl is not None:
+            self.jsonl.write(json.dumps(event) + '\n')
+            self.jsonl.flush()
+
+    # Record a finished page
+    def finish(self, record):
+        for name, seconds in record.timings.items():
+            self.stages[name].observe(seconds)
+        with self.lock:
+            self.counters['pages'] += 1
+            self.counters['cards'] += record.cards
+            self.counters['retries'] += record.retries
+            self.counters['captcha'] += int(record.captcha)
+            self.counters['failed_pages'] += int(record.outcome != 'ok')
+            self._emit({
+                'event': 'page', 'ts': time.time(), 'site': self.site,
+                'role': record.role, 'location': record.location, 'page': record.page,
+                'outcome': record.outcome, 'cards': record.cards, 'retries': record.retries,
+                'captcha': record.captcha, 'bytes': record.bytes,
+                'seconds': round(time.monotonic() - record.started, 3),
+                'timings': {name: round(seconds, 3) for name, seconds in record.timings.items()},
+            })
+            write_prom = self.prom_path and self.counters['pages'] % self.prom_every == 0
+        if write_prom:
+            self.write_prometheus()
+
+    # Record a batch of n jobs written in seconds
+    def saved(self, n, seconds):
+        self.stages['save'].observe(seconds)
+        with self.lock:
+            self.counters['jobs_saved'] += n
+            self._emit({'event': 'save', 'ts': time.time(), 'site': self.site, 'jobs': n,
+                        'seconds': round(seconds, 3)})
+
+    def jobs_per_minute(self):
+        minutes = (time.monotonic() - self.started) / 60
+        return self.counters['jobs_saved'] / minutes if minutes > 0 else 0.0
+
+    # Prometheus text exposition format, written atomically
+    def write_prometheus(self):
+        label = f'site="{self.site}"'
+        lines = []
+        with self.lock:
+            counters = dict(self.counters)
+        for name, value in counters.items():
+            lines.append(f"# TYPE crawl_{name}_total counter")
+            lines.append(f"crawl_{name}_total{{{label}}} {value}")
+        lines.append("# TYPE crawl_jobs_per_minute gauge")
+        lines.append(f"crawl_jobs_per_minute{{{label}}} {self.jobs_per_minute():.2f}")
+        lines.append("# TYPE crawl_stage_seconds histogram")
+        for name, hist in self.stages.items():
+            with hist.lock:
+                cumulative = 0
+                for bound, n in zip(hist.buckets, hist.counts):
+                    cumulative += n
+                    lines.append(f'crawl_stage_seconds_bucket{{{label},stage="{name}",le="{bound}"}} {cumulative}')
+                lines.append(f'crawl_stage_seconds_bucket{{{label},stage="{name}",le="+Inf"}} {hist.count}')
+                lines.append(f'crawl_stage_seconds_sum{{{label},stage="{name}"}} {hist.sum:.3f}')
+                lines.append(f'crawl_stage_seconds_count{{{label},stage="{name}"}} {hist.count}')
+        tmp_path = self.prom_path + '.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write('\n'.join(lines) + '\n')
+            os.replace(tmp_path, self.prom_path)
+        except OSError as e:
+            logging.error(f"Error writing Prometheus metrics to {self.prom_path}: {e}")
+
+    def summary(self):
+        elapsed = time.monotonic() - self.started
+        with self.lock:
+            c = dict(self.counters)
+        lines = [
+            f"Crawl summary ({self.site}): {c['pages']} pages in {elapsed / 60:.1f} min, "
+            f"{c['jobs_saved']} jobs saved ({self.jobs_per_minute():.1f} jobs/min)",
+            f"  cards: {c['cards']} ({c['cards'] / c['pages'] if c['pages'] else 0:.1f}/page), retries: {c['retries']}, "
+            f"CAPTCHA hits: {c['captcha']}, failed pages: {c['failed_pages']}",
+        ]
+        for name, hist in self.stages.items():
+            if hist.count:
+                lines.append(f"  {name:<8} total={hist.sum / 60:.1f} min  {hist.summary()}")
+        return '\n'.join(lines)
+
+    # Write the final Prometheus file and close the JSONL stream
+    def close(self):
+        if self.prom_path:
+            self.write_prometheus()
+        if self.jsonl is not None:
+            self.jsonl.close()
+            self.jsonl = None
@@ -0,0 +1,126 @@
+import argparse
+import glob
+import gzip
+import itertools
+import logging
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+from crawl_engine import run_crawl
+from job_parsers import parse_indeed_cards, parse_naukri_cards, PAGE_SOURCE_PATTERN
+
+# Offline check of the asyncio crawl path. Saved page sources are served from
+# 127.0.0.1 by a small http.server and crawled through run_crawl, so the
+# engine, its per-host buckets and the parsers run end to end without touching
+# the real job boards. Every page must come back with the cards an offline
+# parse of the same file finds.
+#   /page/<n>  - the n-th saved page
+#   any other  - the saved pages in turn, for a scraper run with --base-url
+
+PARSERS = {'indeed': parse_indeed_cards, 'naukri': parse_naukri_cards}
+REPLAY_RATE = 1000  # Requests per second to the local server
+DEFAULT_PATTERNS = ["Data/screenshots/page_source_*.html", "Data/screenshots/page_source_*.html.gz"]
+
+
+def load_pages(paths):
+    pages = []
+    for path in paths:
+        with (gzip.open if path.endswith('.gz') else open)(path, 'rt', encoding='utf-8') as f:
+            pages.append(f.read().encode('utf-8'))
+    return pages
+
+
+# Serve pages on 127.0.0.1 from a background thread; port 0 picks a free port
+def start_server(pages, port=0):
+    served = itertools.count()
+
+    class ReplayHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.startswith('/page/') and self.path[6:].isdigit() and int(self.path[6:]) < len(pages):
+                body = pages[int(self.path[6:])]
+            else:
+                body = pages[next(served) % len(pages)]
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            logging.debug(format % args)
+
+    server = ThreadingHTTPServer(('127.0.0.1', port), ReplayHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+# Crawl every served page through run_crawl and compare its cards with an
+# offline parse. Returns the number of mismatching pages.
+def replay(paths, pages, site, max_in_flight=8):
+    parse = PARSERS[site]
+    labels = []
+    for path in paths:
+        match = PAGE_SOURCE_PATTERN.search(os.path.basename(path))
+        labels.append((match.group('role'), match.group('location')) if match else ('unknown', 'unknown'))
+    server = start_server(pages)
+    base = f"http://127.0.0.1:{server.server_port}"
+
+    async def handle(engine, i):
+        result = await engine.fetch(f"{base}/page/{i}")
+        return result.status, parse(result.text, *labels[i])
+
+    mismatches = []
+
+    def on_result(i, result):
+        status, jobs = result
+        expected = parse(pages[i].decode('utf-8'), *labels[i])
+        if status != 200 or jobs != expected:
+            mismatches.append(i)
+            print(f"{paths[i]}: status {status}, {len(jobs)} job cards, expected {len(expected)}")
+
+    start = time.perf_counter()
+    try:
+        run_crawl(range(len(pages)), handle, on_result, max_in_flight=max_in_flight,
+                  host_rates={urlparse(base).netloc: REPLAY_RATE}, politeness_delay=(0, 0))
+    finally:
+        server.shutdown()
+        server.server_close()
+    elapsed = time.perf_counter() - start
+    print(f"Replayed {len(pages)} pages in {elapsed:.2f}s, {len(mismatches)} mismatches")
+    return len(mismatches)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay saved page sources through the async crawl engine.")
+    parser.add_argument('patterns', nargs='*', default=DEFAULT_PATTERNS,
+                        help="Glob patterns of saved page sources (default: Data/screenshots/page_source_*)")
+    parser.add_argument('--site', choices=sorted(PARSERS), default='indeed', help="Parser for the pages (default: indeed)")
+    parser.add_argument('--max-in-flight', type=int, default=8, help="Concurrent requests (default: 8)")
+    parser.add_argument('--serve', type=int, metavar='PORT', default=None,
+                        help="Only serve the pages on 127.0.0.1:PORT, e.g. for a scraper run with --base-url")
+    args = parser.parse_args()
+
+    paths = sorted(path for pattern in args.patterns for path in glob.glob(pattern))
+    if not paths:
+        print("No page sources found")
+        sys.exit(1)
+    pages = load_pages(paths)
+
+    if args.serve is not None:
+        server = start_server(pages, args.serve)
+        print(f"Serving {len(pages)} pages on http://127.0.0.1:{server.server_port} (Ctrl+C to stop)")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            server.shutdown()
+        return
+    sys.exit(1 if replay(paths, pages, args.site, args.max_in_flight) else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,177 @@
+import logging
+import sqlite3
+import threading
+import time
+
+# Persistent crawl checkpoints shared by Indeed_Scraped.py and Naukri_Scraped.py.
+# Completed (role, location, page) units and the keys of jobs already written
+# to the output are kept in SQLite, so a rerun after a crash skips finished
+# pages and never appends a job twice. The job keys outlive a crawl: a fresh
+# crawl revisits every page but still treats earlier postings as seen.
+
+DEFAULT_STATE_FILE = "Data/crawl_state.db"
+
+# Fields identifying a posting; mirrors DEDUP_KEY in clean_job_data.py
+JOB_KEY_FIELDS = ["Title", "Company", "Location_Detail", "Salary"]
+
+
+def job_key(job):
+    return "|".join(str(job.get(field, "")).strip().lower() for field in JOB_KEY_FIELDS)
+
+
+class CrawlState:
+    def __init__(self, path=DEFAULT_STATE_FILE):
+        self.path = path
+        self.lock = threading.Lock()
+        self.claimed = set()  # (site, key) handed out this run but maybe not committed yet
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS pages (
+                site TEXT, role TEXT, location TEXT, page INTEGER, jobs INTEGER, completed_at REAL,
+                PRIMARY KEY (site, role, location, page)
+            );
+            CREATE TABLE IF NOT EXISTS jobs (
+                site TEXT, job_key TEXT, saved_at REAL,
+                PRIMARY KEY (site, job_key)
+            );
+            CREATE TABLE IF NOT EXISTS sinks (
+                path TEXT PRIMARY KEY, size INTEGER
+            );
+            CREATE TABLE IF NOT EXISTS stops (
+                site TEXT, role TEXT, location TEXT, page INTEGER,
+                PRIMARY KEY (site, role, location)
+            );
+        """)
+        self.conn.commit()
+
+    # (role, location, page) units finished in earlier runs
+    def completed_pages(self, site):
+        with self.lock:
+            rows = self.conn.execute("SELECT role, location, page FROM pages WHERE site = ?", (site,)).fetchall()
+        return {(role, location, page) for role, location, page in rows}
+
+    # Jobs saved by the completed pages of the current crawl
+    def saved_count(self, site):
+        with self.lock:
+            return self.conn.execute("SELECT COALESCE(SUM(jobs), 0) FROM pages WHERE site = ?", (site,)).fetchone()[0]
+
+    # Last page to fetch for each (role, location) whose pagination was cut short
+    def stopped_pages(self, site):
+        with self.lock:
+            rows = self.conn.execute("SELECT role, location, page FROM stops WHERE site = ?", (site,)).fetchall()
+        return {(role, location): page for role, location, page in rows}
+
+    def record_stop(self, site, role, location, page):
+        with self.lock, self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO stops VALUES (?, ?, ?, ?)", (site, role, location, page))
+
+    # Keep only jobs not saved by an earlier run and not already claimed by
+    # another page of this run; the returned jobs are claimed for the caller
+    def new_jobs(self, site, jobs):
+        keys = [job_key(job) for job in jobs]
+        fresh = []
+        with self.lock:
+            seen = {
+                row[0] for row in self.conn.execute(
+                    f"SELECT job_key FROM jobs WHERE site = ? AND job_key IN ({','.join('?' * len(keys))})",
+                    [site, *keys])
+            } if keys else set()
+            for key, job in zip(keys, jobs):
+                if key not in seen and (site, key) not in self.claimed:
+                    self.claimed.add((site, key))
+                    fresh.append(job)
+        return fresh
+
+    # Output file length after the last committed batch (None if unknown)
+    def committed_size(self, path):
+        with self.lock:
+            row = self.conn.execute("SELECT size FROM sinks WHERE path = ?", (path,)).fetchone()
+        return row[0] if row else None
+
+    # Record saved jobs, finished pages and the new output file length in one
+    # transaction. pages is a list of (role, location, page, job_count).
+    def record(self, site, pages, jobs, sink_path=None, sink_size=None):
+        now = time.time()
+        with self.lock, self.conn:
+            self.conn.executemany("INSERT OR IGNORE INTO jobs VALUES (?, ?, ?)",
+                                  [(site, job_key(job), now) for job in jobs])
+            self.conn.executemany("INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?)",
+                                  [(site, role, location, page, count, now) for role, location, page, count in pages])
+            if sink_path is not None:
+                self.conn.execute("INSERT OR REPLACE INTO sinks VALUES (?, ?)", (sink_path, sink_size))
+
+    # Start a new crawl of a site: forget page checkpoints and pagination
+    # stops, but keep the saved job keys as the seen-set
+    def reset(self, site):
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM pages WHERE site = ?", (site,))
+            self.conn.execute("DELETE FROM stops WHERE site = ?", (site,))
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+
+# Connects a job_sink.JobSink to the crawl state: a page is checkpointed in
+# the same transaction as the batch holding its jobs, right after that batch
+# was fsync'd, so a crash re-fetches the page instead of losing or
+# duplicating it. Stage timings of each batch go to metrics when given.
+class CheckpointWriter:
+    def __init__(self, state, site, sink, metrics=None):
+        self.state = state
+        self.site = site
+        self.sink = sink
+        self.metrics = metrics
+        sink.on_commit = self._commit
+
+    @property
+    def buffer(self):
+        return self.sink.buffer
+
+    @property
+    def saved(self):
+        return self.sink.saved
+
+    # Queue the new jobs of one page (as returned by CrawlState.new_jobs).
+    # Partial pages (complete=False, e.g. cut off by the job budget) are saved
+    # but left unmarked so a later run fetches them again.
+    def add(self, item, jobs, complete=True):
+        self.sink.add(jobs, (*item, len(jobs)) if complete else None)
+
+    def flush(self):
+        return self.sink.flush()
+
+    def _commit(self, jobs, pages, size, seconds):
+        self.state.record(self.site, pages, jobs, self.sink.path, size)
+        if self.metrics is not None:
+            self.metrics.saved(len(jobs), seconds)
+
+
+# Stops paginating a (role, location) once a page is mostly postings already
+# seen on earlier pages or in earlier crawls. Pages beyond the stopping page
+# are skipped by every worker; pages already in flight finish normally.
+class NoveltyTracker:
+    def __init__(self, state, site, min_novelty):
+        self.state = state
+        self.site = site
+        self.min_novelty = min_novelty
+        self.lock = threading.Lock()
+        self.stopped = state.stopped_pages(site)
+
+    def skip(self, role, location, page):
+        with self.lock:
+            return page > self.stopped.get((role, location), page)
+
+    # Record the novelty of one page (new cards / all cards); returns True
+    # when pagination of this (role, location) should stop after it
+    def observe(self, role, location, page, total, new):
+        if not total or new / total >= self.min_novelty:
+            return False
+        with self.lock:
+            if page >= self.stopped.get((role, location), page + 1):
+                return True
+            self.stopped[(role, location)] = page
+        self.state.record_stop(self.site, role, location, page)
+        logging.info(f"Stopping {role} in {location} after page {page}: only {new}/{total} cards are new")
+        return True
@@ -0,0 +1,93 @@
+import glob
+import gzip
+import logging
+import os
+import queue
+import random
+import threading
+
+# Debug snapshots of scraped pages. Instead of writing every page source to
+# disk on the scraping thread, pages are handed to a background writer that
+# gzips them and keeps the snapshot directory under a disk quota by deleting
+# the oldest snapshots first.
+#   off     - never capture
+#   error   - capture pages that were blocked, timed out or had no job cards
+#   sampled - capture errors plus a random sample_rate share of good pages
+
+CAPTURE_MODES = ['off', 'error', 'sampled']
+DEFAULT_DIRECTORY = "Data/screenshots"
+SNAPSHOT_PATTERN = "page_source_*.html.gz"
+
+
+class DebugCapture:
+    def __init__(self, mode='error', sample_rate=0.05, directory=DEFAULT_DIRECTORY, quota_mb=100):
+        if mode not in CAPTURE_MODES:
+            raise ValueError(f"Unknown capture mode {mode!r}, expected one of {CAPTURE_MODES}")
+        self.mode = mode
+        self.sample_rate = sample_rate
+        self.directory = directory
+        self.quota_bytes = int(quota_mb * 1024 * 1024)
+        self.pending = queue.Queue(maxsize=64)
+        self.thread = None
+        if mode != 'off':
+            os.makedirs(directory, exist_ok=True)
+            self.thread = threading.Thread(target=self._writer, name="debug-capture", daemon=True)
+            self.thread.start()
+
+    def wants(self, error):
+        if self.mode == 'off':
+            return False
+        return error or (self.mode == 'sampled' and random.random() < self.sample_rate)
+
+    # Queue a page source for saving as {directory}/page_source_{name}.html.gz.
+    # Drops the snapshot rather than blocking the scraper when the writer is behind.
+    def page(self, html, name, error=False):
+        if not self.wants(error):
+            return False
+        try:
+            self.pending.put_nowait((name, html))
+        except queue.Full:
+            logging.warning(f"Debug capture queue full, dropping snapshot {name}")
+            return False
+        return True
+
+    def _writer(self):
+        while True:
+            item = self.pending.get()
+            if item is None:
+                break
+            name, html = item
+            path = os.path.join(self.directory, f"page_source_{name}.html.gz")
+            try:
+                with gzip.open(path, 'wt', encoding='utf-8', compresslevel=6) as f:
+                    f.write(html)
+                logging.info(f"Saved page source to {path}")
+                self._rotate()
+            except OSError as e:
+                logging.error(f"Error saving page source {path}: {e}")
+
+    # Delete the oldest snapshots until the directory fits in the quota
+    def _rotate(self):
+        snapshots = []
+        for path in glob.glob(os.path.join(self.directory, SNAPSHOT_PATTERN)):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            snapshots.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in snapshots)
+        for _, size, path in sorted(snapshots):
+            if total <= self.quota_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError as e:
+                logging.warning(f"Could not rotate snapshot {path}: {e}")
+
+    # Flush queued snapshots and stop the writer thread
+    def close(self):
+        if self.thread is not None:
+            self.pending.put(None)
+            self.thread.join()
+            self.thread = None
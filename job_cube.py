@@ -0,0 +1,182 @@
+import os
+import shutil
+import sys
+
+import numpy as np
+import pandas as pd
+
+from job_store import prepare_for_store, iter_store_parts
+
+# Precomputed aggregate cube for the dashboard charts. Postings are counted per
+# cell of source x location x role x salary, and each cell keeps its top-k
+# skills and companies, so charts are answered in O(cells) instead of
+# O(postings). A cube is a directory of three Parquet files (cells, skills,
+# companies) written next to the cleaned data.
+
+CELL_COLUMNS = ['source', 'location', 'role', 'salary_lakh', 'salary_exact', 'salary_bucket']
+# Store columns the cube is built from
+INPUT_COLUMNS = ['source', 'location', 'role', 'salary_mid', 'salary_bucket', 'skills', 'company']
+TOP_K = 50
+
+# Salaries are counted per whole lakh so any range of the dashboard slider
+# (0-50 lakh, undisclosed counted as 0) can be answered exactly: salary_lakh is
+# the floor and salary_exact marks amounts that are a whole number of lakhs.
+# Everything above the slider's maximum shares the last step.
+SALARY_LAKH_CAP = 51
+
+
+# Cube directory for a cleaned data file or store, e.g. cleaned_job_data.cube
+def cube_path(data_path):
+    return os.path.splitext(data_path)[0] + '.cube'
+
+
+# Count the postings of one top-k dimension (skills, company) per cell, with
+# the cell's key columns so counts of separately counted parts can be added up
+def _value_counts(cells, cell_ids, values):
+    pairs = pd.DataFrame({'cell': cell_ids, 'value': values}).dropna()
+    pairs = pairs[pairs['value'] != '']
+    counts = pairs.groupby(['cell', 'value'], observed=True).size()
+    keys = cells[CELL_COLUMNS].iloc[counts.index.get_level_values('cell')].reset_index(drop=True)
+    return keys.assign(value=counts.index.get_level_values('value'), count=counts.to_numpy())
+
+
+# Untrimmed counts of a store-prepared DataFrame (see job_store.prepare_for_store):
+# postings per cell, and per cell and skill / company. Counts of several parts
+# are combined with merge_counts and turned into a cube with trim_counts.
+def count_cube(df):
+    df = df.reset_index(drop=True)
+    salary = df['salary_mid'].fillna(0).to_numpy(dtype=float)
+    lakhs = np.floor(salary / 100000)
+    keys = pd.DataFrame({
+        'source': df['source'].astype(str),
+        'location': df['location'].astype(str),
+        'role': df['role'].astype(str),
+        'salary_lakh': np.minimum(lakhs, SALARY_LAKH_CAP).astype(np.int16),
+        'salary_exact': lakhs * 100000 == salary,
+        'salary_bucket': df['salary_bucket'].astype(str),
+    })
+    # Cells are numbered in order of first appearance, matching drop_duplicates
+    cell_ids = keys.groupby(CELL_COLUMNS, sort=False).ngroup().to_numpy()
+    cells = keys.drop_duplicates().reset_index(drop=True)
+    cells['count'] = np.bincount(cell_ids, minlength=len(cells))
+
+    skills = df['skills'].where(df['skills'].map(lambda value: isinstance(value, str)))
+    skills = skills.str.split(', ').explode().str.strip()
+    return {
+        'cells': cells,
+        'skills': _value_counts(cells, cell_ids[skills.index.to_numpy()], skills.to_numpy()),
+        'companies': _value_counts(cells, cell_ids, df['company'].astype(str).to_numpy()),
+    }
+
+
+# Add up the counts of two parts; cells keep their order of first appearance
+def merge_counts(counts, other):
+    merged = {}
+    for name, by in (('cells', CELL_COLUMNS), ('skills', CELL_COLUMNS + ['value']),
+                     ('companies', CELL_COLUMNS + ['value'])):
+        table = pd.concat([counts[name], other[name]], ignore_index=True)
+        merged[name] = table.groupby(by, sort=False)['count'].sum().reset_index()
+    return merged
+
+
+# Turn merged counts into a cube: cells are numbered by position, and each
+# cell keeps its top_k skills and companies. Values tied with the k-th largest
+# count are kept too, so a cell's list is only cut where counts drop, never in
+# the middle of a run of equal (often 1) counts.
+def trim_counts(counts, top_k=TOP_K):
+    cells = counts['cells']
+    numbered = cells[CELL_COLUMNS].assign(cell=np.arange(len(cells)))
+    cube = {'cells': cells}
+    for name in ('skills', 'companies'):
+        table = counts[name].merge(numbered, on=CELL_COLUMNS, how='left')
+        pairs = table[['cell', 'value', 'count']].sort_values(['cell', 'value'], kind='stable')
+        rank = pairs.groupby('cell')['count'].rank(method='min', ascending=False)
+        cube[name] = pairs[rank <= top_k].reset_index(drop=True)
+    return cube
+
+
+# Build the cube from a store-prepared DataFrame
+def build_cube(df, top_k=TOP_K):
+    return trim_counts(count_cube(df), top_k)
+
+
+# Build the cube of a store one part at a time. Memory is bounded by the
+# untrimmed counts, not by the number of postings; top-k is cut after merging.
+def build_store_cube(store_path, top_k=TOP_K):
+    counts = None
+    for part in iter_store_parts(store_path, columns=INPUT_COLUMNS):
+        part_counts = count_cube(part)
+        counts = part_counts if counts is None else merge_counts(counts, part_counts)
+    return trim_counts(counts, top_k)
+
+
+def write_cube(cube, path):
+    tmp_path = path + '.tmp'
+    if os.path.isdir(tmp_path):
+        shutil.rmtree(tmp_path)
+    os.makedirs(tmp_path)
+    for name, table in cube.items():
+        table.to_parquet(os.path.join(tmp_path, f'{name}.parquet'), index=False)
+    if os.path.isdir(path):
+        shutil.rmtree(path)
+    os.replace(tmp_path, path)
+
+
+def read_cube(path):
+    cube = {}
+    for name in ('cells', 'skills', 'companies'):
+        cube[name] = pd.read_parquet(os.path.join(path, f'{name}.parquet'))
+    for column in ('source', 'location', 'role', 'salary_bucket'):
+        cube['cells'][column] = cube['cells'][column].astype('category')
+    return cube
+
+
+# Sum counts per value, largest first, like value_counts on the postings
+def _totals(counts, by):
+    totals = counts.groupby(by, observed=True)['count'].sum()
+    totals = totals[totals > 0].sort_values(ascending=False, kind='stable')
+    totals.index.name = by
+    return totals
+
+
+# Chart counts for the dashboard filters that the cube can answer (everything
+# except title search and skills). Skills and companies are merged from the
+# per-cell top-k lists: exact while cells have fewer than TOP_K distinct
+# counts, otherwise a value can miss the counts of cells where it fell below
+# the cut-off.
+def query_cube(cube, source, locations, roles, salary_range):
+    cells = cube['cells']
+    mask = np.ones(len(cells), dtype=bool)
+    if source != "Both":
+        mask &= (cells['source'] == source).to_numpy()
+    if locations:
+        mask &= cells['location'].isin(locations).to_numpy()
+    if roles:
+        mask &= cells['role'].isin(roles).to_numpy()
+    low, high = salary_range
+    lakh = cells['salary_lakh']
+    mask &= ((lakh >= low) & ((lakh < high) | ((lakh == high) & cells['salary_exact']))).to_numpy()
+    selected = cells[mask]
+    cell_ids = np.flatnonzero(mask)
+
+    skills = cube['skills'][cube['skills']['cell'].isin(cell_ids)].rename(columns={'value': 'skills'})
+    companies = cube['companies'][cube['companies']['cell'].isin(cell_ids)].rename(columns={'value': 'company'})
+    return {
+        'role': _totals(selected, 'role'),
+        'salary_bucket': _totals(selected, 'salary_bucket'),
+        'location': _totals(selected, 'location').head(10),
+        'skills': _totals(skills, 'skills').head(10),
+        'company': _totals(companies, 'company').head(10),
+    }
+
+
+# Build a cube next to a cleaned CSV, e.g.
+#   python job_cube.py cleaned_job_data_with_skills.csv
+if __name__ == '__main__':
+    if len(sys.argv) != 2:
+        print("Usage: python job_cube.py <cleaned_csv>")
+        sys.exit(1)
+    csv_path = sys.argv[1]
+    cube = build_cube(prepare_for_store(pd.read_csv(csv_path)))
+    write_cube(cube, cube_path(csv_path))
+    print(f"Saved cube with {len(cube['cells'])} cells to '{cube_path(csv_path)}'")
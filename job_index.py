@@ -0,0 +1,102 @@
+import re
+from bisect import bisect_left
+
+import numpy as np
+import pandas as pd
+
+# Title words, keeping tech names like "c++", "c#" and "node.js" in one piece;
+# underscores separate words ("In_Senior Associate_Python Developer")
+TITLE_TOKEN = re.compile(r"(?:[^\W_]|[+#])+(?:[.'](?:[^\W_]|[+#])+)*")
+
+
+# Build an inverted index over the comma separated skills column.
+# Returns the sorted skill vocabulary and a dict mapping each skill to a sorted
+# array of row positions, so filters become set operations instead of string scans.
+def build_skill_index(skills):
+    skills = pd.Series(skills).reset_index(drop=True)
+    exploded = skills.dropna()
+    exploded = exploded[exploded.map(lambda value: isinstance(value, str))]
+    exploded = exploded.str.split(", ").explode().str.strip()
+    exploded = exploded[exploded != '']
+
+    postings = {}
+    for skill, positions in exploded.groupby(exploded, sort=True).groups.items():
+        postings[skill] = np.unique(np.asarray(positions, dtype=np.int64))
+
+    vocabulary = sorted(postings)
+    return vocabulary, postings
+
+
+# Row positions of postings that list any of the given skills (union)
+def rows_with_any_skill(postings, selected_skills):
+    arrays = [postings[skill] for skill in selected_skills if skill in postings]
+    if not arrays:
+        return np.empty(0, dtype=np.int64)
+    return np.unique(np.concatenate(arrays))
+
+
+# Boolean mask of length n_rows with True at the given row positions
+def positions_to_mask(positions, n_rows):
+    mask = np.zeros(n_rows, dtype=bool)
+    mask[positions] = True
+    return mask
+
+
+# Build a token index over job titles. Titles are case-folded once and kept,
+# tokens map to sorted arrays of row positions, and the sorted vocabulary
+# lets a query word match every token it is a prefix of.
+def build_title_index(titles):
+    folded = pd.Series(titles).reset_index(drop=True).fillna('').astype(str).str.casefold()
+    tokens = folded.str.findall(TITLE_TOKEN).explode().dropna()
+    # Dotted names are also indexed by their parts, so "net" finds "asp.net"
+    dotted = tokens[tokens.str.contains(r"[.']")]
+    tokens = pd.concat([tokens, dotted.str.split(r"[.']", regex=True).explode()])
+
+    postings = {}
+    for token, positions in tokens.groupby(tokens, sort=True).groups.items():
+        postings[token] = np.unique(np.asarray(positions, dtype=np.int64))
+
+    vocabulary = sorted(postings)
+    return folded, vocabulary, postings
+
+
+# Boolean mask of the rows with a title word containing term, found by
+# scanning the vocabulary (or only its words starting with term) instead of
+# the titles
+def _rows_with_token(title_index, term, prefix=False):
+    folded, vocabulary, postings = title_index
+    if prefix:
+        tokens = vocabulary[bisect_left(vocabulary, term):bisect_left(vocabulary, term + '\U0010ffff')]
+    else:
+        tokens = [token for token in vocabulary if term in token]
+    mask = np.zeros(len(folded), dtype=bool)
+    for token in tokens:
+        mask[postings[token]] = True
+    return mask
+
+
+# Row positions of the titles containing the query, like a substring search.
+# Every word of the query lies inside one title word, so the substring check
+# only runs on rows the vocabulary scan leaves (none at all for a one-word
+# query: "ops" matches "DevOps" straight from the index). Several words also
+# match titles with a word starting with each of them ("data ana" matches
+# "Data Analyst" too).
+def search_titles(title_index, query):
+    folded = title_index[0]
+    query = query.strip().casefold()
+    terms = TITLE_TOKEN.findall(query)
+    if not terms:
+        return np.flatnonzero(folded.str.contains(query, regex=False).to_numpy())
+    candidates = np.ones(len(folded), dtype=bool)
+    for term in terms:
+        candidates &= _rows_with_token(title_index, term)
+    if terms == [query]:
+        return np.flatnonzero(candidates)
+    rows = np.flatnonzero(candidates)
+    matches = np.zeros(len(folded), dtype=bool)
+    matches[rows] = folded.iloc[rows].str.contains(query, regex=False).to_numpy()
+    if terms == query.split():
+        for term in terms:
+            candidates &= _rows_with_token(title_index, term, prefix=True)
+        matches |= candidates
+    return np.flatnonzero(matches)
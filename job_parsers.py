@@ -0,0 +1,86 @@
+import glob
+import gzip
+import os
+import re
+import sys
+
+from bs4 import BeautifulSoup
+
+from job_sources import job_record
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Offline parsers for saved or fetched search result pages. One BeautifulSoup
+# pass per page replaces the per-card WebDriver find_element round-trips.
+
+
+def _text(node, selector, default):
+    found = node.select_one(selector)
+    if found is None:
+        return default
+    return found.get_text(' ', strip=True)
+
+
+# Parse every Indeed job card (div.job_seen_beacon) in a page source
+def parse_indeed_cards(html, role, location):
+    soup = BeautifulSoup(html, HTML_PARSER)
+    jobs = []
+    for card in soup.select('div.job_seen_beacon'):
+        jobs.append(job_record(
+            role, location,
+            _text(card, "h2.jobTitle a span", "N/A"),
+            _text(card, "span[data-testid='company-name']", "N/A"),
+            _text(card, "div[data-testid='text-location']", "N/A"),
+            _text(card, "div[data-testid='attribute_snippet_testid']", "Not Disclosed"),
+            [skill.get_text(' ', strip=True) for skill in card.select("div.jobsearch-Skills-container")]
+        ))
+    return jobs
+
+
+# Parse every Naukri job card (div.srp-jobtuple-wrapper) in a page source
+def parse_naukri_cards(html, role, location):
+    soup = BeautifulSoup(html, HTML_PARSER)
+    jobs = []
+    for card in soup.select('.srp-jobtuple-wrapper'):
+        jobs.append(job_record(
+            role, location,
+            _text(card, ".title", "N/A"),
+            _text(card, ".comp-name", "N/A"),
+            _text(card, ".locWdth", "N/A"),
+            _text(card, ".sal", "Not Disclosed"),
+            [skill.get_text(' ', strip=True) for skill in card.select(".skill")]
+        ))
+    return jobs
+
+
+# True when a page source is a CAPTCHA or robot-check page
+def is_blocked_page(html, url=''):
+    return "robot" in url or "captcha" in html.lower()
+
+
+# Debug page sources are saved as page_source_{role}_{location}_page_{page}_attempt_{n}.html[.gz]
+PAGE_SOURCE_PATTERN = re.compile(r'page_source_(?P<role>.+)_(?P<location>[^_]+)_page_\d+_attempt_\d+\.html(\.gz)?$')
+
+
+# Parse saved Indeed page sources offline, e.g.
+#   python job_parsers.py "Data/screenshots/page_source_*.html.gz"
+if __name__ == '__main__':
+    patterns = sys.argv[1:] or ["Data/screenshots/page_source_*.html", "Data/screenshots/page_source_*.html.gz"]
+    paths = sorted(path for pattern in patterns for path in glob.glob(pattern))
+    if not paths:
+        print("No page sources found")
+        sys.exit(1)
+    total = 0
+    for path in paths:
+        match = PAGE_SOURCE_PATTERN.search(os.path.basename(path))
+        role, location = (match.group('role'), match.group('location')) if match else ('unknown', 'unknown')
+        with (gzip.open if path.endswith('.gz') else open)(path, 'rt', encoding='utf-8') as f:
+            html = f.read()
+        jobs = parse_indeed_cards(html, role, location)
+        total += len(jobs)
+        print(f"{path}: {len(jobs)} job cards{' (blocked)' if is_blocked_page(html) else ''}")
+    print(f"Parsed {total} job cards from {len(paths)} pages")
@@ -0,0 +1,92 @@
+import json
+import logging
+import os
+import time
+
+# Buffered JSONL output for scraped jobs. Records are kept in memory and
+# appended in batches once flush_rows are waiting or the oldest is
+# flush_seconds old. Each batch is written with a single write + fsync, and
+# only then reported to on_commit(jobs, markers, size), so whoever tracks
+# progress (crawl_state.CheckpointWriter) never records a batch that is not
+# on disk. Skills stay native JSON lists instead of stringified Python lists.
+
+
+class JobSink:
+    # committed_size: file length after the last batch known to be committed.
+    # Anything beyond it is a torn or uncommitted batch from a crash and is cut off.
+    def __init__(self, path, flush_rows=200, flush_seconds=30.0, committed_size=None, on_commit=None):
+        self.path = path
+        self.flush_rows = flush_rows
+        self.flush_seconds = flush_seconds
+        self.on_commit = on_commit
+        self.buffer = []
+        self.markers = []
+        self.saved = 0
+        self.oldest = None
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.file = open(path, 'ab')
+        self.size = self._recover(committed_size)
+
+    def _recover(self, committed_size):
+        size = self.file.seek(0, os.SEEK_END)
+        if committed_size is None or committed_size > size:
+            # No commit record: only drop a trailing partial line
+            with open(self.path, 'rb') as f:
+                f.seek(max(0, size - 65536))
+                tail = f.read()
+            if tail and not tail.endswith(b'\n'):
+                committed_size = size - len(tail) + tail.rfind(b'\n') + 1
+            else:
+                committed_size = size
+        if committed_size < size:
+            logging.warning(f"Discarding {size - committed_size} uncommitted bytes at the end of {self.path}")
+            self.file.truncate(committed_size)
+        return committed_size
+
+    # Buffer the jobs of one unit of work; marker (e.g. a page id) is passed to
+    # on_commit together with the batch that contains these jobs
+    def add(self, jobs, marker=None):
+        if self.oldest is None:
+            self.oldest = time.monotonic()
+        self.buffer.extend(jobs)
+        if marker is not None:
+            self.markers.append(marker)
+        if self.due():
+            self.flush()
+
+    def due(self):
+        if self.oldest is None:
+            return False
+        return len(self.buffer) >= self.flush_rows or time.monotonic() - self.oldest >= self.flush_seconds
+
+    # Append the buffered jobs as one batch; returns False (keeping the buffer) if the write failed
+    def flush(self):
+        if not self.buffer and not self.markers:
+            return True
+        data = ''.join(json.dumps(job, ensure_ascii=False) + '\n' for job in self.buffer).encode('utf-8')
+        start = time.monotonic()
+        try:
+            self.file.write(data)
+            self.file.flush()
+            os.fsync(self.file.fileno())
+        except OSError as e:
+            logging.error(f"Error saving {len(self.buffer)} jobs to {self.path}: {e}")
+            try:
+                self.file.truncate(self.size)
+            except OSError:
+                pass
+            return False
+        self.size += len(data)
+        seconds = time.monotonic() - start
+        logging.info(f"Saved {len(self.buffer)} jobs to {self.path} in {seconds:.3f}s")
+        if self.on_commit is not None:
+            self.on_commit(self.buffer, self.markers, self.size, seconds)
+        self.saved += len(self.buffer)
+        self.buffer = []
+        self.markers = []
+        self.oldest = None
+        return True
+
+    def close(self):
+        self.flush()
+        self.file.close()
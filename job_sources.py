@@ -0,0 +1,101 @@
+import io
+import json
+from abc import ABC, abstractmethod
+
+import pandas as pd
+
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+# Raw job record format shared by the scrapers and the cleaner, and the
+# registry of source readers clean_job_data.py walks. Supporting another job
+# board means writing records with job_record() and registering a reader.
+
+
+# Build one raw job record. Skills is a list of strings; everything else is a
+# string, with "N/A" / "Not Disclosed" when the card had no value.
+def job_record(role, location, title, company, location_detail, salary, skills):
+    return {
+        "Role": role,
+        "Location": location,
+        "Title": title,
+        "Company": company,
+        "Location_Detail": location_detail,
+        "Salary": salary,
+        "Skills": list(skills),
+    }
+
+
+# A reader turns batches of complete raw lines from one file into a DataFrame
+# of raw records with a 'source' column. has_header tells the cleaner to skip
+# (and pass along) a CSV header line. Readers must be picklable, since their
+# parse method is shipped to worker processes.
+class SourceReader(ABC):
+    has_header = False
+
+    # required: the cleaner refuses to run when no file of this source exists
+    def __init__(self, source, path, required=False):
+        self.source = source
+        self.path = path
+        self.required = required
+
+    @abstractmethod
+    def parse(self, lines, names=None):
+        pass
+
+
+# Legacy Naukri CSV export (Skills stored as stringified Python lists)
+class CsvReader(SourceReader):
+    has_header = True
+
+    def parse(self, lines, names=None):
+        df = pd.read_csv(io.BytesIO(b''.join(lines)), header=None, names=names)
+        df['source'] = self.source
+        return df
+
+
+# JSON Lines written by job_sink.JobSink. The whole batch is decoded as one
+# JSON array in a single loads call (orjson when installed), about twice as
+# fast as a loads per line. If any line is malformed, or a line holding
+# several objects ("{...},{...}") makes the array longer than the batch, the
+# batch falls back to decoding line by line and skipping the bad lines.
+class JsonLinesReader(SourceReader):
+    def parse(self, lines, names=None):
+        lines = [line for line in (line.strip() for line in lines) if line]
+        try:
+            records = json_loads(b'[' + b','.join(lines) + b']')
+        except ValueError:
+            records = None
+        if records is None or len(records) != len(lines):
+            records = self._parse_lines(lines)
+        df = pd.DataFrame(records)
+        df['source'] = self.source
+        return df
+
+    def _parse_lines(self, lines):
+        records = []
+        for line in lines:
+            line = line.strip()
+            if line:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError as e:
+                    print(f"Skipping invalid JSON line: {e}")
+        return records
+
+
+READERS = []
+
+
+def register(reader):
+    READERS.append(reader)
+    return reader
+
+
+# Raw files are read in this order; the first record of a dedup key wins
+register(CsvReader('Naukri', 'naukri_selenium_fixed.csv', required=True))
+register(JsonLinesReader('Naukri', 'naukri_selenium_fixed.jsonl', required=True))
+register(JsonLinesReader('Indeed', 'indeed_selenium_fixed.json', required=True))
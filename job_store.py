@@ -0,0 +1,89 @@
+import os
+import shutil
+import sys
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from salary_parser import parse_salary, salary_bucket, SALARY_COLUMNS
+from canonical import canonical_locations, canonical_companies
+
+# Columnar storage for the cleaned dataset. A store is a directory of Parquet
+# parts (part-00000.parquet, ...) that is memory-mapped on read, with the
+# low-cardinality text columns kept as categoricals.
+
+CATEGORICAL_COLUMNS = ['location', 'role', 'source', 'company', 'salary_period', 'salary_bucket']
+
+
+# Normalize role names to match the dashboard (e.g., "Data-Analyst" -> "Data Analyst")
+def normalize_roles(roles):
+    return roles.astype(str).str.replace('-', ' ').str.title()
+
+
+# Bring a cleaned DataFrame into the store layout: normalized roles,
+# canonical locations and companies, numeric salary columns, salary bucket
+# and categorical dtypes
+def prepare_for_store(df):
+    df = df.copy()
+    df['role'] = normalize_roles(df['role'])
+    df['location'] = canonical_locations(df['location'])
+    df['company'] = canonical_companies(df['company'])
+    if not set(SALARY_COLUMNS).issubset(df.columns):
+        df[SALARY_COLUMNS] = parse_salary(df['salary'])
+    df['salary_bucket'] = salary_bucket(df['salary_mid'])
+    for column in CATEGORICAL_COLUMNS:
+        df[column] = df[column].astype(str).astype('category')
+    # Scraped skills may still be Python lists; store them as text like the CSV does
+    df['skills'] = df['skills'].where(df['skills'].isna(), df['skills'].astype(str))
+    return df.reset_index(drop=True)
+
+
+# Replace the store at path with the given DataFrame
+def write_store(df, path):
+    if os.path.isdir(path):
+        shutil.rmtree(path)
+    os.makedirs(path, exist_ok=True)
+    table = pa.Table.from_pandas(prepare_for_store(df), preserve_index=False)
+    pq.write_table(table, os.path.join(path, 'part-00000.parquet'))
+
+
+# Add the given DataFrame to the store as a new part
+def append_store(df, path):
+    if not os.path.isdir(path):
+        write_store(df, path)
+        return
+    part = len([name for name in os.listdir(path) if name.endswith('.parquet')])
+    table = pa.Table.from_pandas(prepare_for_store(df), preserve_index=False)
+    pq.write_table(table, os.path.join(path, f'part-{part:05d}.parquet'))
+
+
+# Memory-map the parts of the store (or only the given columns) one at a time,
+# yielding a DataFrame per part
+def iter_store_parts(path, columns=None):
+    for name in sorted(name for name in os.listdir(path) if name.endswith('.parquet')):
+        yield pq.read_table(os.path.join(path, name), columns=columns, memory_map=True).to_pandas()
+
+
+# Memory-map every part of the store (or only the given columns) into one DataFrame
+def read_store(path, columns=None):
+    parts = sorted(name for name in os.listdir(path) if name.endswith('.parquet'))
+    tables = [pq.read_table(os.path.join(path, name), columns=columns, memory_map=True) for name in parts]
+    df = pa.concat_tables(tables, promote_options='permissive').to_pandas()
+    # Parts written separately carry their own dictionaries; keep categoricals after concat
+    for column in CATEGORICAL_COLUMNS:
+        if column in df.columns and not isinstance(df[column].dtype, pd.CategoricalDtype):
+            df[column] = df[column].astype('category')
+    return df
+
+
+# Convert a cleaned CSV into a store next to it, e.g.
+#   python job_store.py cleaned_job_data_with_skills.csv
+if __name__ == '__main__':
+    if len(sys.argv) != 2:
+        print("Usage: python job_store.py <cleaned_csv>")
+        sys.exit(1)
+    csv_path = sys.argv[1]
+    store_path = os.path.splitext(csv_path)[0] + '.parquet'
+    write_store(pd.read_csv(csv_path), store_path)
+    print(f"Saved store to '{store_path}'")
@@ -0,0 +1,193 @@
+import argparse
+import re
+import time
+import zlib
+from collections import Counter, defaultdict
+
+import numpy as np
+import pandas as pd
+
+from canonical import canonical_location, COMPANY_SUFFIXES
+
+# Near-duplicate postings across sources. Exact dedup in clean_job_data.py
+# misses the same job listed on Naukri and Indeed, or posted by
+# "Acme Pvt Ltd" and "Acme Private Limited". Comparing every pair of titles
+# is O(n^2), so postings are first blocked by normalized company and city,
+# and inside a block titles are bucketed with MinHash/LSH; only candidates
+# sharing a bucket get an exact token-set (Jaccard) check.
+
+DEFAULT_INPUT = 'cleaned_job_data.csv'
+NEAR_DUPLICATES_FILE = 'near_duplicates.csv'
+DEFAULT_THRESHOLD = 0.7
+NUM_PERM = 32
+BANDS = 16  # 16 bands of 2 rows: a pair with Jaccard 0.7 shares a bucket with probability > 0.99
+
+TITLE_STOPWORDS = {'and', 'or', 'the', 'for', 'of', 'in', 'at', 'a', 'an', 'to', 'with', 'job', 'jobs', 'opening'}
+
+_TOKEN = re.compile(r'[a-z0-9+#]+')
+_PRIME = 4294967291  # largest prime below 2^32, so (a * x + b) fits in uint64
+
+
+def normalize_company(company):
+    tokens = _TOKEN.findall(str(company).lower().replace('&', ' and '))
+    return ' '.join(token for token in tokens if token not in COMPANY_SUFFIXES)
+
+
+# Canonical city of a location such as "Bengaluru, Karnataka"
+def normalize_city(location):
+    return canonical_location(location).lower()
+
+
+def title_tokens(title):
+    return frozenset(token for token in _TOKEN.findall(str(title).lower()) if token not in TITLE_STOPWORDS)
+
+
+def jaccard(a, b):
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+# MinHash signatures (one row per token set) using NUM_PERM universal hash functions
+def minhash_signatures(token_sets, num_perm=NUM_PERM, seed=1):
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, _PRIME, size=num_perm, dtype=np.uint64)
+    b = rng.integers(0, _PRIME, size=num_perm, dtype=np.uint64)
+    signatures = np.full((len(token_sets), num_perm), np.iinfo(np.uint64).max, dtype=np.uint64)
+    for i, tokens in enumerate(token_sets):
+        if tokens:
+            hashes = np.array([zlib.crc32(token.encode()) for token in tokens], dtype=np.uint64)
+            signatures[i] = ((np.outer(hashes, a) + b) % _PRIME).min(axis=0)
+    return signatures
+
+
+class UnionFind:
+    def __init__(self, n):
+        self.parent = np.arange(n)
+
+    def find(self, i):
+        root = i
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[i] != root:
+            self.parent[i], i = root, self.parent[i]
+        return root
+
+    def union(self, i, j):
+        root_i, root_j = self.find(i), self.find(j)
+        if root_i != root_j:
+            self.parent[max(root_i, root_j)] = min(root_i, root_j)
+
+
+# Cluster id for every row: rows in the same cluster are near-duplicates.
+# The id is the position of the cluster's first row, so singletons keep their own position.
+def find_near_duplicates(df, threshold=DEFAULT_THRESHOLD, num_perm=NUM_PERM, bands=BANDS):
+    n = len(df)
+    uf = UnionFind(n)
+    blocks = [
+        normalize_company(company) + '|' + normalize_city(location)
+        for company, location in zip(df['company'], df['location'])
+    ]
+    titles = [title_tokens(title) for title in df['title']]
+
+    # Identical (block, title tokens) rows are merged directly; only one
+    # representative per distinct title in a block goes through LSH
+    representatives = {}
+    for i, key in enumerate(zip(blocks, titles)):
+        if key in representatives:
+            uf.union(representatives[key], i)
+        else:
+            representatives[key] = i
+    rep_rows = list(representatives.values())
+    signatures = minhash_signatures([titles[i] for i in rep_rows], num_perm)
+
+    rows_per_band = num_perm // bands
+    buckets = defaultdict(list)
+    for k, i in enumerate(rep_rows):
+        for band in range(bands):
+            band_values = signatures[k, band * rows_per_band:(band + 1) * rows_per_band].tobytes()
+            buckets[(blocks[i], band, band_values)].append(i)
+
+    # Each bucket member is checked against the bucket's first row only, so
+    # the work stays linear in the bucket size
+    for members in buckets.values():
+        first = members[0]
+        for i in members[1:]:
+            if jaccard(titles[first], titles[i]) >= threshold:
+                uf.union(first, i)
+    return np.array([uf.find(i) for i in range(n)])
+
+
+# Cluster size distribution and cross-source counts for a clustering
+def cluster_report(df, cluster_ids):
+    sizes = Counter(cluster_ids)
+    multi = {cluster for cluster, size in sizes.items() if size > 1}
+    in_multi = np.isin(cluster_ids, list(multi))
+    sources_per_cluster = pd.Series(df['source'].to_numpy()[in_multi]).groupby(cluster_ids[in_multi]).nunique()
+    size_counts = Counter(sizes[cluster] for cluster in multi)
+    lines = [
+        f"Rows: {len(df)}, clusters: {len(sizes)}, near-duplicate clusters: {len(multi)}",
+        f"Rows in near-duplicate clusters: {int(in_multi.sum())} "
+        f"({int(in_multi.sum()) - len(multi)} removable)",
+        f"Clusters spanning more than one source: {int((sources_per_cluster > 1).sum())}",
+        "Cluster sizes:",
+    ]
+    for size in sorted(size_counts):
+        lines.append(f"  {size:>4}: {size_counts[size]} clusters")
+    return '\n'.join(lines)
+
+
+# Time the blocked detector on growing samples, next to a naive all-pairs
+# Jaccard comparison. The naive run is only measured up to naive_limit rows
+# and extrapolated quadratically (marked ~) beyond that.
+def benchmark(df, threshold=DEFAULT_THRESHOLD, naive_limit=4000):
+    print(f"{'rows':>8} {'blocked (s)':>12} {'naive (s)':>10}")
+    measured = None
+    for fraction in (0.125, 0.25, 0.5, 1.0):
+        sample = df.iloc[:max(1, int(len(df) * fraction))]
+        start = time.perf_counter()
+        find_near_duplicates(sample, threshold)
+        blocked = time.perf_counter() - start
+        if len(sample) <= naive_limit:
+            titles = [title_tokens(title) for title in sample['title']]
+            start = time.perf_counter()
+            for i in range(len(titles)):
+                for j in range(i + 1, len(titles)):
+                    jaccard(titles[i], titles[j])
+            measured = (len(sample), time.perf_counter() - start)
+            naive = f"{measured[1]:.2f}"
+        elif measured:
+            naive = f"~{measured[1] * (len(sample) / measured[0]) ** 2:.2f}"
+        else:
+            naive = ''
+        print(f"{len(sample):>8} {blocked:>12.2f} {naive:>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Find near-duplicate job postings across sources.")
+    parser.add_argument('input', nargs='?', default=DEFAULT_INPUT, help=f"Cleaned job CSV (default: {DEFAULT_INPUT})")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f"Minimum title token-set similarity (default: {DEFAULT_THRESHOLD})")
+    parser.add_argument('--output', default=NEAR_DUPLICATES_FILE,
+                        help=f"CSV receiving the rows of every near-duplicate cluster (default: {NEAR_DUPLICATES_FILE})")
+    parser.add_argument('--benchmark', action='store_true', help="Time the detector on growing samples of the input")
+    args = parser.parse_args()
+
+    df = pd.read_csv(args.input)
+    if args.benchmark:
+        benchmark(df, args.threshold)
+        return
+
+    start = time.perf_counter()
+    cluster_ids = find_near_duplicates(df, args.threshold)
+    print(f"Clustered {len(df)} rows in {time.perf_counter() - start:.2f}s")
+    print(cluster_report(df, cluster_ids))
+
+    sizes = pd.Series(cluster_ids).map(Counter(cluster_ids)).to_numpy()
+    clustered = df.assign(cluster=cluster_ids)[sizes > 1].sort_values(['cluster', 'source'], kind='stable')
+    clustered.to_csv(args.output, index=False)
+    print(f"Near-duplicate clusters saved to '{args.output}'")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+import time
+
+# Adaptive replacement for the fixed sleep / scroll / WebDriverWait sequence.
+# The page is polled until the number of job cards and of network requests
+# has stopped changing for stable_for seconds, so a page that renders in one
+# second is parsed after about one second instead of after 5-8. Politeness
+# between requests is the rate limiter's job, not the waiter's.
+
+# One round-trip per poll: card count, requests issued so far, block marker.
+# Scrolling to the bottom on every poll triggers lazily loaded cards.
+POLL_JS = """
+var cards = document.querySelectorAll(arguments[0]).length;
+var blocked = arguments[1] ? document.querySelectorAll(arguments[1]).length > 0 : false;
+if (arguments[2] && document.body) { window.scrollTo(0, document.body.scrollHeight); }
+return [cards, performance.getEntriesByType('resource').length, blocked, document.readyState];
+"""
+
+
+# Wait until card_selector matches a stable, non-zero number of elements.
+# Returns (cards, seconds waited, blocked); blocked is True as soon as
+# block_selector (e.g. a CAPTCHA widget) appears. On timeout (e.g. a page whose
+# analytics keep issuing requests) cards is the last count seen once the
+# document has loaded, and 0 before that.
+def wait_for_cards(driver, card_selector, timeout=30, block_selector=None, scroll=True, poll=0.25, stable_for=0.75):
+    start = time.monotonic()
+    last = None
+    stable_since = start
+    while True:
+        now = time.monotonic()
+        cards, requests, blocked, ready = driver.execute_script(POLL_JS, card_selector, block_selector, scroll)
+        if blocked:
+            return 0, now - start, True
+        if (cards, requests) != last:
+            last = (cards, requests)
+            stable_since = now
+        elif cards and ready == 'complete' and now - stable_since >= stable_for:
+            return cards, now - start, False
+        if now - start >= timeout:
+            return (cards if ready == 'complete' else 0), now - start, False
+        time.sleep(poll)
@@ -0,0 +1,50 @@
+import asyncio
+import random
+import threading
+import time
+from urllib.parse import urlparse
+
+
+# Per-domain politeness limiter shared by scraper workers. Requests to the same
+# host are spaced at least min_interval seconds apart (plus random jitter),
+# no matter how many workers are fetching from it.
+class RateLimiter:
+    def __init__(self, min_interval, jitter=0.0):
+        self.min_interval = min_interval
+        self.jitter = jitter
+        self.next_slot = {}
+        self.lock = threading.Lock()
+
+    # Block until the caller may send a request to the host of url
+    def wait(self, url):
+        host = urlparse(url).netloc
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot.get(host, now))
+            self.next_slot[host] = slot + self.min_interval + random.uniform(0, self.jitter)
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+
+# Token bucket for the asyncio crawl engine: allows bursts of up to capacity
+# requests, then refills at rate requests per second
+class AsyncTokenBucket:
+    def __init__(self, rate, capacity=1):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
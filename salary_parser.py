@@ -0,0 +1,155 @@
+import sys
+
+import numpy as np
+import pandas as pd
+
+# Vectorized salary parsing shared by clean_job_data.py and Job_app.py.
+# Raw strings from Naukri ("35-37.5 Lacs PA"), Indeed ("₹25,000 - ₹30,000 a month",
+# "Up to ₹9,00,000 a year") and already cleaned values ("15000-30000") are turned
+# into annual rupee amounts plus the period they were quoted in. Salaries quoted
+# in another currency ("$20 - $25 an hour") are not converted: they get NaN
+# amounts and count as undisclosed rather than landing in the rupee buckets.
+
+SALARY_COLUMNS = ['salary_min', 'salary_max', 'salary_mid', 'salary_period']
+
+# Multipliers to convert a quoted amount into a yearly amount
+PERIOD_TO_YEAR = {
+    'hour': 2080,
+    'day': 260,
+    'week': 52,
+    'month': 12,
+    'year': 1,
+    'unknown': 1,
+}
+
+# Order matters: the first matching period wins
+PERIOD_PATTERNS = [
+    ('hour', r'(?:\b(?:an?\s+hour|per\s+hour|hourly|p\.?h\.?)\b|/\s*(?:hr|hour)\b)'),
+    ('day', r'(?:\b(?:a\s+day|per\s+day|daily)\b|/\s*day\b)'),
+    ('week', r'(?:\b(?:a\s+week|per\s+week|weekly)\b|/\s*(?:week|wk)\b)'),
+    ('month', r'(?:\ba\s+month\b|\bper\s+month\b|\bmonthly\b|/\s*month\b|/\s*mo\b|\bp\.?m\.?$)'),
+    ('year', r'(?:\ba\s+year\b|\bper\s+(?:year|annum)\b|\byearly\b|\bannual|/\s*(?:year|yr|annum)\b|\bp\.?a\.?\b|\blpa\b)'),
+]
+
+LAKH_PATTERN = r'\b(?:lpa|lacs?|lakhs?|l)\b'
+CRORE_PATTERN = r'\b(?:crores?|cr)\b'
+THOUSAND_PATTERN = r'\d\s*k\b'
+CURRENCY_PATTERN = r'(?:₹|\brs\.?|\binr\b)'
+FOREIGN_CURRENCY_PATTERN = r'(?:\$|€|£|\busd\b|\beur\b|\bgbp\b)'
+CLEANED_PATTERN = r'^\d+(?:\.\d+)?(?:\s*-\s*\d+(?:\.\d+)?)?$'
+
+AMOUNT_PATTERN = (
+    r'(?P<prefix>up\s*to|upto|from)?[^\d]*'
+    r'(?P<low>\d+(?:\.\d+)?)'
+    r'(?:\s*[a-z]*\s*(?:-|–|to)\s*[^\d\s]*\s*(?P<high>\d+(?:\.\d+)?))?'
+)
+
+SALARY_BUCKETS = ['<₹5L', '₹5L-₹10L', '>₹10L']
+
+
+# Parse a Series of raw salary strings into salary_min, salary_max, salary_mid
+# (float, rupees per year) and salary_period (the period the salary was quoted in).
+# Undisclosed or unparseable salaries get NaN amounts and an empty period.
+def parse_salary(salary):
+    salary = pd.Series(salary)
+    text = salary.astype('string').str.lower().str.replace(',', '', regex=False).str.strip()
+
+    period = pd.Series('unknown', index=salary.index, dtype=object)
+    found = pd.Series(False, index=salary.index)
+    for name, pattern in PERIOD_PATTERNS:
+        matched = text.str.contains(pattern, regex=True).fillna(False).astype(bool) & ~found
+        period[matched] = name
+        found |= matched
+
+    is_lakh = text.str.contains(LAKH_PATTERN, regex=True).fillna(False).astype(bool)
+    is_crore = text.str.contains(CRORE_PATTERN, regex=True).fillna(False).astype(bool)
+    is_thousand = text.str.contains(THOUSAND_PATTERN, regex=True).fillna(False).astype(bool)
+    has_currency = text.str.contains(CURRENCY_PATTERN, regex=True).fillna(False).astype(bool)
+    is_cleaned = text.str.match(CLEANED_PATTERN).fillna(False).astype(bool)
+    is_foreign = text.str.contains(FOREIGN_CURRENCY_PATTERN, regex=True).fillna(False).astype(bool)
+
+    # Only trust the numbers when the text looks like a salary, so strings
+    # such as "Full-time +2" are not read as an amount
+    looks_like_salary = (has_currency | is_lakh | is_crore | is_thousand | found | is_cleaned) & ~is_foreign
+
+    amounts = text.str.extract(AMOUNT_PATTERN)
+    low = pd.to_numeric(amounts['low'], errors='coerce').to_numpy(dtype=float)
+    high = pd.to_numeric(amounts['high'], errors='coerce').to_numpy(dtype=float)
+    high = np.where(np.isnan(high), low, high)
+    prefix = amounts['prefix'].fillna('').str.replace(' ', '', regex=False).to_numpy(dtype=object)
+
+    scale = np.select(
+        [is_crore.to_numpy(), is_lakh.to_numpy(), is_thousand.to_numpy()],
+        [1e7, 1e5, 1e3],
+        default=1.0,
+    )
+    per_year = period.map(PERIOD_TO_YEAR).to_numpy(dtype=float)
+    factor = np.where(looks_like_salary.to_numpy(), scale * per_year, np.nan)
+
+    salary_min = low * factor
+    salary_max = high * factor
+    # "Up to X" only bounds the top, "From X" only bounds the bottom
+    salary_min = np.where(prefix == 'upto', np.nan, salary_min)
+    salary_max = np.where(prefix == 'from', np.nan, salary_max)
+    salary_mid = np.where(
+        np.isnan(salary_min), salary_max,
+        np.where(np.isnan(salary_max), salary_min, (salary_min + salary_max) / 2),
+    )
+
+    period = period.where(~np.isnan(salary_mid), '')
+    return pd.DataFrame({
+        'salary_min': salary_min,
+        'salary_max': salary_max,
+        'salary_mid': salary_mid,
+        'salary_period': period,
+    }, index=salary.index)
+
+
+# Display label used in the cleaned data: "low-high" in rupees per year,
+# a single amount when only one bound is known, or "Not Disclosed"
+def salary_label(parsed):
+    low = parsed['salary_min'].round().astype('Int64').astype('string')
+    high = parsed['salary_max'].round().astype('Int64').astype('string')
+    label = (low + '-' + high).where(parsed['salary_min'].ne(parsed['salary_max']), low)
+    label = label.fillna(low).fillna(high).fillna('Not Disclosed')
+    return label.astype(object)
+
+
+# Bucket the numeric mid salary into the ranges shown on the dashboard
+def salary_bucket(salary_mid):
+    salary_mid = pd.Series(salary_mid, dtype=float)
+    values = salary_mid.to_numpy()
+    bucket = np.select(
+        [np.isnan(values), values < 500000, values <= 1000000],
+        ['Not Disclosed', SALARY_BUCKETS[0], SALARY_BUCKETS[1]],
+        default=SALARY_BUCKETS[2],
+    )
+    return pd.Series(bucket, index=salary_mid.index)
+
+
+# Sanity-check the parser on known strings, e.g.
+#   python salary_parser.py
+if __name__ == '__main__':
+    examples = {
+        "35-37.5 Lacs PA": 3625000,
+        "₹25,000 - ₹30,000 a month": 330000,
+        "Up to ₹9,00,000 a year": 900000,
+        "₹500/hr": 1040000,
+        "₹500 /hr": 1040000,
+        "₹500 / hour": 1040000,
+        "₹2,000 / day": 520000,
+        "₹10,000 /week": 520000,
+        "₹10,000 / wk": 520000,
+        "₹40,000 / month": 480000,
+        "15000-30000": 22500,
+        "$20 - $25 an hour": np.nan,
+        "Not Disclosed": np.nan,
+    }
+    parsed = parse_salary(list(examples))
+    failed = 0
+    for text, expected, got in zip(examples, examples.values(), parsed['salary_mid']):
+        ok = (np.isnan(expected) and np.isnan(got)) or got == expected
+        failed += not ok
+        print(f"{'ok  ' if ok else 'FAIL'} {text!r}: {got} (expected {expected})")
+    print(f"{len(examples) - failed} of {len(examples)} salaries parsed as expected")
+    sys.exit(1 if failed else 0)